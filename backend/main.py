@@ -1,7 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from rasa_client import send_to_rasa
+from rasa_client import client, send_to_rasa
 
 app = FastAPI()
 
@@ -19,5 +19,9 @@ class ChatRequest(BaseModel):
 
 @app.post("/chat")
 async def chat(request: ChatRequest):
-    response = send_to_rasa(request.session_id, request.message)
+    response = await send_to_rasa(request.session_id, request.message)
     return response
+
+@app.on_event("shutdown")
+async def close_client():
+    await client.aclose()
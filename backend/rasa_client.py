@@ -1,14 +1,20 @@
-import requests
+import httpx
 
 RASA_URL = "http://rasa:5005/webhooks/rest/webhook" 
 
-def send_to_rasa(sender_id: str, message: str):
+# One pooled client for the process: keep-alive connections are reused across chats
+client = httpx.AsyncClient(
+    timeout=10,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+)
+
+async def send_to_rasa(sender_id: str, message: str):
     payload = {
         "sender": sender_id,
         "message": message
     }
     try:
-        res = requests.post(RASA_URL, json=payload, timeout=10)
+        res = await client.post(RASA_URL, json=payload)
         return res.json()
     except Exception as e:
-        return {"error": str(e)}
\ No newline at end of file
+        return {"error": str(e)}
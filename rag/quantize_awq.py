@@ -0,0 +1,27 @@
+import os
+import sys
+from awq import AutoAWQForCausalLM
+from transformers import AutoTokenizer
+
+MODEL_ID = "mistralai/Ministral-8B-Instruct-2410"
+QUANT_PATH = sys.argv[1] if len(sys.argv) > 1 else "ministral-8b-awq"
+
+# GEMV kernels are fastest at batch=1; service.py micro-batches up to BATCH_MAX_SIZE prompts,
+# where GEMM kernels win, so GEMV is only the default when batching is turned off
+AWQ_VERSION = os.getenv("AWQ_VERSION", "GEMM" if int(os.getenv("BATCH_MAX_SIZE", "8")) > 1 else "GEMV")
+QUANT_CONFIG = {"zero_point": True, "q_group_size": 128, "w_bit": 4, "version": AWQ_VERSION}
+
+
+def quantize():
+    token = os.getenv("HF_TOKEN")
+    model = AutoAWQForCausalLM.from_pretrained(MODEL_ID, token=token, safetensors=True)
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_ID, token=token)
+
+    model.quantize(tokenizer, quant_config=QUANT_CONFIG)
+    model.save_quantized(QUANT_PATH)
+    tokenizer.save_pretrained(QUANT_PATH)
+    print(f"AWQ model saved at: {QUANT_PATH}")
+
+
+if __name__ == "__main__":
+    quantize()
@@ -1,38 +1,235 @@
+import copy
+import hashlib
+import math
+import os
+import threading
+from collections import OrderedDict
+import faiss
+import numpy as np
 import torch
 from langchain_community.vectorstores import FAISS
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from sentence_transformers import CrossEncoder
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+# Probes per query when the loaded index is IVF-based (recall vs. latency knob)
+FAISS_NPROBE = int(os.getenv("FAISS_NPROBE", "16"))
+
+# Bounded caches for warm FAQ-style traffic
+CACHE_SIZE = int(os.getenv("RETRIEVER_CACHE_SIZE", "1024"))
+SCORE_CACHE_SIZE = int(os.getenv("RERANKER_SCORE_CACHE_SIZE", "16384"))
+
+# "torch" (sentence-transformers CrossEncoder) or "onnx" (optimum + onnxruntime)
+RERANKER_BACKEND = os.getenv("RERANKER_BACKEND", "torch").lower()
+# Default >= retrieve() top_k, so a full candidate set goes through in one forward pass
+RERANKER_BATCH_SIZE = int(os.getenv("RERANKER_BATCH_SIZE", "32"))
+RERANKER_COMPILE = os.getenv("RERANKER_COMPILE", "0") == "1"
+# Dynamic int8 quantization of the reranker's Linear layers on the CPU path; opt-in until its
+# effect on ranking quality has been measured
+RERANKER_INT8 = os.getenv("RERANKER_INT8", "0") == "1"
+
+# Token limit per (query, passage) pair, and a character cap so text past it is never tokenized
+RERANKER_MAX_LENGTH = int(os.getenv("RERANKER_MAX_LENGTH", "512"))
+RERANKER_MAX_CHARS = RERANKER_MAX_LENGTH * 4
+
+# Intra-op threads per worker process on the CPU path (split across uvicorn workers)
+TORCH_NUM_THREADS = int(
+    os.getenv("TORCH_NUM_THREADS", max(1, (os.cpu_count() or 1) // int(os.getenv("WEB_CONCURRENCY", "1"))))
+)
+
+# Skip the CrossEncoder when the best bi-encoder cosine similarity is already this high
+# (bge-m3 cosines run higher than mpnet's, hence a stricter default than 0.75)
+BI_ENCODER_SHORTCUT = float(os.getenv("BI_ENCODER_SHORTCUT", "0.85"))
+
+
+class LRUCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        # retrieve() runs in worker threads, so reordering/eviction must not interleave
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            value = self.data.get(key)
+            if value is not None:
+                self.data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            if len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Each 8-bit PQ codebook has 256 centroids, so training needs at least that many vectors
+PQ_MIN_TRAIN = 256
+
+
+def build_ivfpq_index(vectorstore_path: str, factory: Optional[str] = None) -> str:
+    """
+    One-shot offline rebuild of the saved flat index as a compressed IVF+PQ index.
+    The LangChain docstore / id mapping is kept as-is, only index.faiss is swapped.
+    Corpora too small to train PQ keep their flat index; returns the factory string used ("Flat" then).
+    """
+    index_file = os.path.join(vectorstore_path, "index.faiss")
+    flat = faiss.read_index(index_file)
+    dim = flat.d
+
+    if factory is None:
+        if flat.ntotal < PQ_MIN_TRAIN:
+            return "Flat"
+        # ~4*sqrt(N) lists, capped so every centroid still gets enough training points
+        nlist = max(1, min(int(4 * math.sqrt(flat.ntotal)), flat.ntotal // 39, 32768))
+        if flat.ntotal >= 1_000_000 and dim % 64 == 0:
+            factory = f"OPQ64,IVF{nlist},PQ64"
+        else:
+            factory = f"IVF{nlist},PQ32"
+
+    xb = flat.reconstruct_n(0, flat.ntotal)
+    index = faiss.index_factory(dim, factory, flat.metric_type)
+    index.train(xb)
+    index.add(xb)
+    faiss.write_index(index, index_file)
+    return factory
+
+
+class OnnxCrossEncoder:
+    """
+    Thin ONNX Runtime wrapper exposing the same predict(pairs, batch_size) as CrossEncoder.
+    The model is exported and graph-optimized once on first load.
+    """
+
+    def __init__(self, model_name: str, device: str, max_length: int = 512):
+        import onnxruntime as ort
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTOptimizer
+        from optimum.onnxruntime.configuration import OptimizationConfig
+        from transformers import AutoTokenizer
+
+        self.max_length = max_length
+        export_dir = os.path.join(
+            os.getenv("ONNX_CACHE_DIR", "onnx_models"), model_name.replace("/", "__")
+        )
+        use_cuda = device.startswith("cuda")
+
+        if not os.path.isdir(export_dir):
+            model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+            optimizer = ORTOptimizer.from_pretrained(model)
+            optimizer.optimize(
+                save_dir=export_dir,
+                optimization_config=OptimizationConfig(optimization_level=99, optimize_for_gpu=use_cuda),
+            )
+            AutoTokenizer.from_pretrained(model_name).save_pretrained(export_dir)
+
+        session_options = ort.SessionOptions()
+        session_options.intra_op_num_threads = os.cpu_count()
+        self.model = ORTModelForSequenceClassification.from_pretrained(
+            export_dir,
+            file_name="model_optimized.onnx",
+            provider="CUDAExecutionProvider" if use_cuda else "CPUExecutionProvider",
+            provider_options={"device_id": int(device.split(":")[1])} if use_cuda else None,
+            session_options=session_options,
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(export_dir)
+
+    def predict(self, pairs, batch_size: int = 32):
+        scores = []
+        for start in range(0, len(pairs), batch_size):
+            batch = pairs[start:start + batch_size]
+            features = self.tokenizer(
+                [q for q, _ in batch], [p for _, p in batch],
+                padding=True, truncation=True, max_length=self.max_length, return_tensors="pt"
+            )
+            logits = self.model(**features).logits
+            scores.extend(logits.reshape(-1).tolist())
+        # bge-reranker is a single-logit model; CrossEncoder applies sigmoid by default
+        return 1 / (1 + np.exp(-np.asarray(scores)))
 
 
 class Reranker:
     def __init__(self, model_name="BAAI/bge-reranker-v2-m3"):
-        self.model = CrossEncoder(
-            model_name,
-            device="cuda:1" if torch.cuda.device_count() > 1 else "cuda:0"
-        )
+        if not torch.cuda.is_available():
+            device = "cpu"
+        else:
+            device = "cuda:1" if torch.cuda.device_count() > 1 else "cuda:0"
+        if RERANKER_BACKEND == "onnx":
+            self.model = OnnxCrossEncoder(model_name, device, max_length=RERANKER_MAX_LENGTH)
+        else:
+            self.model = CrossEncoder(model_name, device=device, max_length=RERANKER_MAX_LENGTH)
+            if torch.cuda.is_available():
+                self.model.model.half()
+            elif RERANKER_INT8:
+                self.model.model = torch.quantization.quantize_dynamic(
+                    self.model.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            if RERANKER_COMPILE and hasattr(torch, "compile"):
+                self.model.model = torch.compile(self.model.model, mode="reduce-overhead")
+        self._score_cache = LRUCache(SCORE_CACHE_SIZE)
 
     def rerank(self, query: str, docs: List[Any], top_k: int = 3) -> List[Any]:
         if not docs:
             return []
 
-        pairs = [(query, d.page_content) for d in docs]
-        scores = self.model.predict(pairs).tolist()
+        query_key = _digest(query)
+        keys = [(query_key, _digest(d.page_content)) for d in docs]
+        scores = [self._score_cache.get(k) for k in keys]
 
-        scored_docs = sorted(
-            zip(docs, scores),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        # Only run the CrossEncoder on pairs not scored before
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            # Length-sorted so each batch pads to a similar length; scores map back through `missing`
+            missing.sort(key=lambda i: len(docs[i].page_content))
+            pairs = [(query, docs[i].page_content[:RERANKER_MAX_CHARS]) for i in missing]
+            with torch.inference_mode():
+                predicted = self.model.predict(pairs, batch_size=RERANKER_BATCH_SIZE).tolist()
+            for i, score in zip(missing, predicted):
+                scores[i] = score
+                self._score_cache.put(keys[i], score)
+
+        # Partial selection of the top_k, then order only those
+        scores = np.asarray(scores)
+        if top_k < len(scores):
+            top_idx = np.argpartition(-scores, top_k)[:top_k]
+        else:
+            top_idx = np.arange(len(scores))
+        top_idx = top_idx[np.argsort(-scores[top_idx], kind="stable")]
 
-        return [{"text": doc.page_content, "source": doc.metadata.get("source", ""), "score": float(score)} for doc, score in scored_docs[:top_k]]
+        return [
+            {"text": docs[i].page_content, "source": docs[i].metadata.get("source", ""), "score": float(scores[i]),
+             "score_type": "rerank"}
+            for i in top_idx
+        ]
 
 
 class Retriever:
-    def __init__(self, vectorstore_path: str):
+    def __init__(
+        self,
+        vectorstore_path: str,
+        model_name: str = "BAAI/bge-m3",
+        reranker_name: str = "BAAI/bge-reranker-v2-m3",
+        top_k: int = 25,
+        return_k: int = 8
+    ):
+        self.top_k = top_k
+        self.return_k = return_k
+
+        if not torch.cuda.is_available():
+            # Avoid oversubscribing cores shared with uvicorn workers
+            torch.set_num_threads(TORCH_NUM_THREADS)
+            try:
+                torch.set_num_interop_threads(1)
+            except RuntimeError:
+                pass  # interop pool already started
+
         self.embeddings = HuggingFaceEmbeddings(
-            model_name="BAAI/bge-m3",
-            model_kwargs={'device': 'cuda:0'},
+            model_name=model_name,
+            model_kwargs={'device': 'cuda:0' if torch.cuda.is_available() else 'cpu'},
             encode_kwargs={'normalize_embeddings': True}
         )
 
@@ -42,23 +239,76 @@ class Retriever:
             allow_dangerous_deserialization=True
         )
 
-        self.reranker = Reranker()
+        # LangChain returns raw FAISS scores: inner product, or squared L2 distance by default
+        self._inner_product = self.vectorstore.index.metric_type == faiss.METRIC_INNER_PRODUCT
+
+        ivf = faiss.try_extract_index_ivf(self.vectorstore.index)
+        if ivf is not None:
+            ivf.nprobe = FAISS_NPROBE
+
+        # faiss-cpu builds have no GPU symbols; only move the index when faiss-gpu is installed
+        self.gpu_resources = None
+        if torch.cuda.is_available() and hasattr(faiss, "StandardGpuResources"):
+            self.gpu_resources = faiss.StandardGpuResources()
+            self.vectorstore.index = faiss.index_cpu_to_gpu(self.gpu_resources, 0, self.vectorstore.index)
+
+        self.reranker = Reranker(reranker_name)
+        self._result_cache = LRUCache(CACHE_SIZE)
+        self._embed_cache = LRUCache(CACHE_SIZE)
+
+    def embed_query(self, query: str) -> List[float]:
+        vector = self._embed_cache.get(query)
+        if vector is None:
+            vector = self.embeddings.embed_query(query)
+            self._embed_cache.put(query, vector)
+        return vector
 
-    def retrieve(self, query: str, top_k: int = 25, return_k: int = 8) -> List[Dict[str, Any]]:
+    def _similarity(self, score: float) -> float:
+        # Embeddings are normalized, so squared L2 distance d maps to cosine 1 - d / 2
+        return float(score) if self._inner_product else 1.0 - float(score) / 2.0
+
+    def retrieve(self, query: str, top_k: Optional[int] = None, return_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Returns a list of dicts: [{"text": ..., "source": ..., "score": ...}, ...]
-        Using Dynamic Priority logic.
+        Returns a list of dicts: [{"text": ..., "source": ..., "score": ..., "score_type": "cosine" | "rerank"}, ...]
+        Using Dynamic Priority logic. top_k / return_k default to the instance settings.
         """
-        retrieved_docs = self.vectorstore.similarity_search(query, k=top_k)
-        if not retrieved_docs:
+        top_k = top_k or self.top_k
+        return_k = return_k or self.return_k
+        # The same normalized string keys the cache and drives the search, so a hit returns what a miss would
+        query = query.strip()
+        cache_key = (query, top_k, return_k)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        retrieved = self.vectorstore.similarity_search_with_score_by_vector(self.embed_query(query), k=top_k)
+        if not retrieved:
             return []
 
-        dynamic_priority = [d for d in retrieved_docs if "ewubd.edu" in d.metadata.get("source", "")]
-        static_others = [d for d in retrieved_docs if "ewubd.edu" not in d.metadata.get("source", "")]
+        dynamic_priority = [(d, s) for d, s in retrieved if "ewubd.edu" in d.metadata.get("source", "")]
+        static_others = [(d, s) for d, s in retrieved if "ewubd.edu" not in d.metadata.get("source", "")]
+        candidates = dynamic_priority or static_others
 
-        if dynamic_priority:
-            reranked = self.reranker.rerank(query, dynamic_priority, top_k=return_k)
+        # FAISS results come back best-first, so the head of the list is the top bi-encoder match
+        if self._similarity(candidates[0][1]) >= BI_ENCODER_SHORTCUT:
+            reranked = [
+                {"text": d.page_content, "source": d.metadata.get("source", ""), "score": self._similarity(s),
+                 "score_type": "cosine"}
+                for d, s in candidates[:return_k]
+            ]
         else:
-            reranked = self.reranker.rerank(query, static_others, top_k=return_k)
+            reranked = self.reranker.rerank(query, [d for d, _ in candidates], top_k=return_k)
+
+        self._result_cache.put(cache_key, reranked)
+        return copy.deepcopy(reranked)
+
+
+if __name__ == "__main__":
+    # Run after ingest.ipynb saves the vectorstore: python retriever.py --build-ivfpq [vectorstore_path] [factory]
+    import sys
 
-        return reranked
+    if "--build-ivfpq" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--build-ivfpq"]
+        path = args[0] if args else "vectorstore"
+        used = build_ivfpq_index(path, args[1] if len(args) > 1 else None)
+        print(f"{path}/index.faiss: {used}")
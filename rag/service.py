@@ -1,10 +1,20 @@
 import os
 os.environ["PYTORCH_CUDA_ALLOC_CONF"] = "expandable_segments:True"
+# Must be set before torch / numpy load their OpenMP and MKL runtimes
+_cpu_threads = str(max(1, (os.cpu_count() or 1) // int(os.getenv("WEB_CONCURRENCY", "1"))))
+os.environ.setdefault("OMP_NUM_THREADS", _cpu_threads)
+os.environ.setdefault("MKL_NUM_THREADS", _cpu_threads)
 
+import asyncio
+import copy
+import importlib.util
 import time
 import math
+from collections import deque
+import numpy as np
 from fastapi import FastAPI
 from pydantic import BaseModel
+from typing import List
 from retriever import Retriever
 import transformers
 import torch
@@ -16,37 +26,257 @@ if not HF_TOKEN:
 login(HF_TOKEN)
 
 VECTORSTORE_PATH = "vectorstore"
-retriever = Retriever(VECTORSTORE_PATH)
+# Must match the model the vectorstore was built with in ingest.ipynb (bge-m3 covers Bangla/Banglish)
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "BAAI/bge-m3")
+retriever = Retriever(VECTORSTORE_PATH, model_name=EMBEDDING_MODEL)
 
 model_id = "mistralai/Ministral-8B-Instruct-2410"
 
-bnb_config = transformers.BitsAndBytesConfig(
-    load_in_4bit=True,
-    bnb_4bit_quant_type="nf4",
-    bnb_4bit_use_double_quant=True,
-    bnb_4bit_compute_dtype=torch.bfloat16
-)
-
-tokenizer = transformers.AutoTokenizer.from_pretrained(model_id, token=HF_TOKEN)
-model = transformers.AutoModelForCausalLM.from_pretrained(
-    model_id,
-    token=HF_TOKEN,
-    quantization_config=bnb_config,
-    device_map="auto",
-    trust_remote_code=True
-)
-
-generator = transformers.pipeline(
-    "text-generation",
-    model=model,
-    tokenizer=tokenizer,
-    max_new_tokens=768,
-    temperature=0.3,
-    top_p=0.9,
-    repetition_penalty=1.05,
-    return_full_text=False,
-    do_sample=True
-)
+# "hf" (transformers pipeline + bitsandbytes) or "vllm" (PagedAttention + continuous batching)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "hf").lower()
+
+# Pre-quantized AWQ checkpoint from quantize_awq.py; replaces bitsandbytes NF4 when set
+AWQ_MODEL_PATH = os.getenv("AWQ_MODEL_PATH")
+
+# Answers are short FAQ replies; Bangla needs roughly 3x the tokens of English, hence the headroom
+MAX_NEW_TOKENS = int(os.getenv("MAX_NEW_TOKENS", "384"))
+# Contexts passed to the prompt after reranking
+RETURN_K = int(os.getenv("RETURN_K", "5"))
+TEMPERATURE = 0.3
+TOP_P = 0.9
+REPETITION_PENALTY = 1.05
+
+# Concurrent /rag/query prompts are grouped into one generate call
+BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", "8"))
+BATCH_MAX_WAIT_MS = float(os.getenv("BATCH_MAX_WAIT_MS", "10"))
+
+# Near-duplicate questions (cosine >= threshold on the query embedding, same top_k) reuse a previous answer.
+# Off by default (size 0): bge-m3 puts program-swapped questions ("CSE tuition fee" / "EEE tuition fee")
+# close together, so validate the threshold on such pairs before enabling it.
+SEMANTIC_CACHE_SIZE = int(os.getenv("SEMANTIC_CACHE_SIZE", "0"))
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.99"))
+
+# Static instruction block shared by every request; kept first so its KV cache can be reused
+PROMPT_PREFIX = """<|system|>
+You are a helpful and knowledgeable assistant for East West University (EWU).
+Use only the provided context to answer questions.
+
+CRITICAL INSTRUCTION FOR LANGUAGE:
+If the user asks the question in English, answer in English.
+If the user asks in Bangla (বাংলা), answer completely in standard Bangla.
+If the user asks in Banglish (Romanized Bengali, e.g., "admission deadline kobe?"), answer in friendly Banglish.
+If unsure, say: "I don't have enough information to answer that." / "আমার কাছে এই তথ্যটি নেই।"
+Keep answers accurate and concise.
+<|user|>
+"""
+
+if LLM_BACKEND == "vllm":
+    from vllm import LLM, SamplingParams
+
+    llm = LLM(
+        model=AWQ_MODEL_PATH or model_id,
+        tokenizer_mode="auto" if AWQ_MODEL_PATH else "mistral",
+        quantization="awq" if AWQ_MODEL_PATH else None,
+        dtype="half",
+        enable_prefix_caching=True,
+        max_model_len=int(os.getenv("VLLM_MAX_MODEL_LEN", "4096"))
+    )
+    sampling_params = SamplingParams(
+        max_tokens=MAX_NEW_TOKENS,
+        temperature=TEMPERATURE,
+        top_p=TOP_P,
+        repetition_penalty=REPETITION_PENALTY
+    )
+
+    def generate_batch(prompts: List[str]) -> List[str]:
+        return [out.outputs[0].text.strip() for out in llm.generate(prompts, sampling_params, use_tqdm=False)]
+
+else:
+    if AWQ_MODEL_PATH:
+        from awq import AutoAWQForCausalLM
+
+        tokenizer = transformers.AutoTokenizer.from_pretrained(AWQ_MODEL_PATH)
+        # Fused layers preallocate their KV cache for `batch_size` sequences and reject larger batches,
+        # so size it for the biggest batch MicroBatcher can hand to generate_batch
+        model = AutoAWQForCausalLM.from_quantized(
+            AWQ_MODEL_PATH,
+            fuse_layers=True,
+            batch_size=BATCH_MAX_SIZE,
+            safetensors=True
+        ).model
+    else:
+        bnb_config = transformers.BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_quant_type="nf4",
+            bnb_4bit_use_double_quant=True,
+            bnb_4bit_compute_dtype=torch.bfloat16
+        )
+
+        # FlashAttention-2 (flash-attn>=2.3, SM80+) when installed, otherwise PyTorch SDPA
+        attn_implementation = "flash_attention_2" if importlib.util.find_spec("flash_attn") else "sdpa"
+
+        tokenizer = transformers.AutoTokenizer.from_pretrained(model_id, token=HF_TOKEN)
+        model = transformers.AutoModelForCausalLM.from_pretrained(
+            model_id,
+            token=HF_TOKEN,
+            quantization_config=bnb_config,
+            attn_implementation=attn_implementation,
+            torch_dtype=torch.bfloat16,
+            device_map="auto",
+            trust_remote_code=True
+        )
+
+    # Left padding so batched prompts end right where generation starts
+    tokenizer.padding_side = "left"
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+
+    generator = transformers.pipeline(
+        "text-generation",
+        model=model,
+        tokenizer=tokenizer,
+        max_new_tokens=MAX_NEW_TOKENS,
+        temperature=TEMPERATURE,
+        top_p=TOP_P,
+        repetition_penalty=REPETITION_PENALTY,
+        return_full_text=False,
+        do_sample=True
+    )
+
+    prefix_ids = None
+    prefix_cache = None
+    if not AWQ_MODEL_PATH:
+        # AWQ fused layers keep their own cache, so prefix reuse only applies to the HF model
+        prefix_ids = tokenizer(PROMPT_PREFIX, return_tensors="pt").input_ids.to(model.device)
+        with torch.inference_mode():
+            prefix_cache = model(prefix_ids, use_cache=True).past_key_values
+
+    def generate(prompt: str) -> str:
+        if prefix_cache is None:
+            return generator(prompt)[0]["generated_text"].strip()
+
+        inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
+        prefix_len = prefix_ids.shape[1]
+        if not torch.equal(inputs.input_ids[0, :prefix_len], prefix_ids[0]):
+            return generator(prompt)[0]["generated_text"].strip()
+
+        # generate() extends the cache in place, so each request works on its own copy
+        output = model.generate(
+            **inputs,
+            past_key_values=copy.deepcopy(prefix_cache),
+            max_new_tokens=MAX_NEW_TOKENS,
+            temperature=TEMPERATURE,
+            top_p=TOP_P,
+            repetition_penalty=REPETITION_PENALTY,
+            do_sample=True,
+            pad_token_id=tokenizer.eos_token_id
+        )
+        return tokenizer.decode(output[0, inputs.input_ids.shape[1]:], skip_special_tokens=True).strip()
+
+    def generate_batch(prompts: List[str]) -> List[str]:
+        if len(prompts) == 1:
+            return [generate(prompts[0])]
+
+        inputs = tokenizer(prompts, return_tensors="pt", padding=True).to(model.device)
+        with torch.inference_mode():
+            output = model.generate(
+                **inputs,
+                max_new_tokens=MAX_NEW_TOKENS,
+                temperature=TEMPERATURE,
+                top_p=TOP_P,
+                repetition_penalty=REPETITION_PENALTY,
+                do_sample=True,
+                pad_token_id=tokenizer.pad_token_id
+            )
+        texts = tokenizer.batch_decode(output[:, inputs.input_ids.shape[1]:], skip_special_tokens=True)
+        return [t.strip() for t in texts]
+
+
+class MicroBatcher:
+    """
+    Collects prompts for up to max_wait_ms (or max_size prompts) and generates them together.
+    The worker task is started lazily on the serving event loop.
+    """
+
+    def __init__(self, max_size: int, max_wait_ms: float):
+        self.max_size = max_size
+        self.max_wait = max_wait_ms / 1000
+        self.queue = None
+        self.worker = None
+
+    async def submit(self, prompt: str) -> str:
+        if self.worker is None:
+            self.queue = asyncio.Queue()
+            self.worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((prompt, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                outputs = await asyncio.to_thread(generate_batch, [prompt for prompt, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), text in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(text)
+
+
+batcher = MicroBatcher(BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS)
+
+
+class SemanticCache:
+    """
+    Recent (normalized query embedding, top_k, response) entries; a lookup is one small matmul.
+    Only entries retrieved with the same top_k can match. Only touched from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, maxsize: int, threshold: float):
+        self.threshold = threshold
+        self.entries = deque(maxlen=maxsize)
+        self.matrix = None
+        self.top_ks = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.entries.maxlen > 0
+
+    def lookup(self, vector: np.ndarray, top_k: int):
+        if not self.entries:
+            return None
+        if self.matrix is None:
+            self.matrix = np.stack([v for v, _, _ in self.entries])
+            self.top_ks = np.array([k for _, k, _ in self.entries])
+        sims = np.where(self.top_ks == top_k, self.matrix @ vector, -np.inf)
+        best = int(np.argmax(sims))
+        if sims[best] >= self.threshold:
+            return self.entries[best][2]
+        return None
+
+    def add(self, vector: np.ndarray, top_k: int, response: dict):
+        self.entries.append((vector, top_k, response))
+        self.matrix = None
+
+
+semantic_cache = SemanticCache(SEMANTIC_CACHE_SIZE, SEMANTIC_CACHE_THRESHOLD)
 
 class QueryRequest(BaseModel):
     query: str
@@ -55,10 +285,18 @@ class QueryRequest(BaseModel):
 app = FastAPI()
 
 @app.post("/rag/query")
-def rag_query(req: QueryRequest):
+async def rag_query(req: QueryRequest):
     start = time.time()
 
-    contexts = retriever.retrieve(req.query, top_k=req.top_k, return_k=8)
+    query_vector = None
+    if semantic_cache.enabled:
+        query_vector = np.asarray(await asyncio.to_thread(retriever.embed_query, req.query), dtype=np.float32)
+        cached = semantic_cache.lookup(query_vector, req.top_k)
+        if cached is not None:
+            return {**cached, "sources": list(cached["sources"]), "processing_time": round(time.time() - start, 3)}
+
+    # FAISS search + CrossEncoder are blocking; keep them off the event loop
+    contexts = await asyncio.to_thread(retriever.retrieve, req.query, req.top_k, RETURN_K)
     if not contexts:
         return {
             "response": "I don't have enough information to answer that. / আমার কাছে এই তথ্যটি নেই।",
@@ -67,43 +305,38 @@ def rag_query(req: QueryRequest):
             "processing_time": round(time.time() - start, 3)
         }
 
-    context_text = "\n\n".join([c["text"] for c in contexts])
-
-    prompt = f"""<|system|>
-You are a helpful and knowledgeable assistant for East West University (EWU).
-Use only the provided context to answer questions.
+    # Single pass over the retrieved contexts
+    texts, sources, scores = zip(*[(c["text"], c.get("source", ""), c.get("score", 0.0)) for c in contexts])
+    sources = list(sources)
+    context_text = "\n\n".join(texts)
 
-CRITICAL INSTRUCTION FOR LANGUAGE:
-If the user asks the question in English, answer in English.
-If the user asks in Bangla (বাংলা), answer completely in standard Bangla.
-If the user asks in Banglish (Romanized Bengali, e.g., "admission deadline kobe?"), answer in friendly Banglish.
-If unsure, say: "I don't have enough information to answer that." / "আমার কাছে এই তথ্যটি নেই।"
-Keep answers accurate and concise.
-<|user|>
-CONTEXT: {context_text}
+    prompt = f"""{PROMPT_PREFIX}CONTEXT: {context_text}
 QUESTION: {req.query}
 <|assistant|>
 """
 
     try:
-        generated = generator(prompt)[0]["generated_text"].strip()
+        generated = await batcher.submit(prompt)
     except Exception as e:
         return {
             "response": f"Error generating response: {str(e)}",
             "confidence": 0.0,
-            "sources": [c.get("source", "") for c in contexts],
+            "sources": sources,
             "processing_time": round(time.time() - start, 3)
         }
 
-    scores = [c.get("score", 0.0) for c in contexts]
-    if scores:
-        confidence = 1 / (1 + math.exp(-max(scores)))
+    # Shortcut results carry cosine similarities, already in [0, 1]; reranker scores keep the sigmoid mapping
+    if contexts[0].get("score_type") == "cosine":
+        confidence = max(scores)
     else:
-        confidence = 0.5
+        confidence = 1 / (1 + math.exp(-max(scores)))
 
-    return {
+    result = {
         "response": generated,
         "confidence": round(confidence, 3),
-        "sources": [c.get("source", "") for c in contexts],
+        "sources": sources,
         "processing_time": round(time.time() - start, 3)
     }
+    if query_vector is not None:
+        semantic_cache.add(query_vector, req.top_k, {**result, "sources": list(sources)})
+    return result
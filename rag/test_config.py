@@ -2,6 +2,7 @@ import torch
 import transformers
 import bitsandbytes as bnb
 import os
+import sys
 
 def test_config():
     print("Testing RAG v2 configuration...")
@@ -30,5 +31,26 @@ def test_config():
 
     print("\nConfiguration check complete.")
 
+def test_generate_batch():
+    """Loads the configured model (HF_TOKEN, AWQ_MODEL_PATH, LLM_BACKEND) and runs one batched generate call"""
+    print("Testing batched generation...")
+
+    import service
+
+    prompts = [
+        f"{service.PROMPT_PREFIX}CONTEXT: EWU is in Aftabnagar, Dhaka.\nQUESTION: Where is EWU?\n<|assistant|>\n",
+        f"{service.PROMPT_PREFIX}CONTEXT: EWU has a central library.\nQUESTION: Does EWU have a library?\n<|assistant|>\n",
+    ]
+    outputs = service.generate_batch(prompts)
+    assert len(outputs) == len(prompts), f"expected {len(prompts)} outputs, got {len(outputs)}"
+    for text in outputs:
+        assert text, "empty generation"
+        print(f"✅ {text[:80]}")
+
+    print("\nBatched generation check complete.")
+
 if __name__ == "__main__":
     test_config()
+    # Loads the full model, so only on request: python test_config.py --generate
+    if "--generate" in sys.argv:
+        test_generate_batch()
@@ -2,22 +2,53 @@ import os
 import json
 import requests
 import logging
+import signal
 import aiohttp
 import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Text, Dict, List
+from requests.adapters import HTTPAdapter
 from rasa_sdk import Action, Tracker
 from rasa_sdk.executor import CollectingDispatcher
 from rasa_sdk.events import UserUtteranceReverted, SlotSet
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+RAG_API_URL = os.environ.get("RAG_API_URL", "https://promissory-alexander-measurelessly.ngrok-free.dev/rag/query")
+RAG_TIMEOUT = aiohttp.ClientTimeout(total=500)
+
+# Shared keep-alive session for the RAG service (created lazily on the action server's event loop)
+_rag_session = None
+
+def get_rag_session() -> aiohttp.ClientSession:
+    global _rag_session
+    if _rag_session is None or _rag_session.closed:
+        _rag_session = aiohttp.ClientSession(
+            timeout=RAG_TIMEOUT,
+            headers={"Ngrok-Skip-Browser-Warning": "true"},
+            connector=aiohttp.TCPConnector(limit=32)
+        )
+    return _rag_session
+
+# query -> pending RAG request, so identical concurrent fallbacks hit the service once
+_rag_inflight: Dict[str, asyncio.Future] = {}
+
 class ActionPhi3RagAnswer(Action):
     """RAG-powered answer generation using TinyLlama"""
     def name(self) -> Text:
         # change the action name here
         return "action_call_rag"
 
-    def run(
+    async def run(
         self,
         dispatcher: CollectingDispatcher,
         tracker: Tracker,
@@ -34,14 +65,27 @@ class ActionPhi3RagAnswer(Action):
         history = self._build_history(tracker)
 
         # Call RAG service with TinyLlama
-        answer, confidence, sources, processing_time = self._call_rag(user_message)
+        answer, confidence, sources, processing_time = await self._call_rag(user_message)
 
         # Send appropriate response based on confidence
         self._send_response(dispatcher, answer, confidence, sources, processing_time)
 
         return []
 
-    def _call_rag(self, query: str) -> tuple:
+    async def _call_rag(self, query: str) -> tuple:
+        """
+        Call RAG service, sharing the in-flight request when the same question is already pending
+        (the service batches distinct concurrent queries into one generate call on its side)
+        """
+        pending = _rag_inflight.get(query)
+        if pending is None:
+            pending = asyncio.ensure_future(self._request_rag(query))
+            _rag_inflight[query] = pending
+            pending.add_done_callback(lambda _: _rag_inflight.pop(query, None))
+        # shield: one caller being cancelled must not cancel the request the others are waiting on
+        return await asyncio.shield(pending)
+
+    async def _request_rag(self, query: str) -> tuple:
         """
         Call RAG service (TinyLlama-powered) and return structured response
 
@@ -56,12 +100,14 @@ class ActionPhi3RagAnswer(Action):
             }
 
             #logger.info(f"RAG Query: {query[:50]}...")
-            RAG_API_URL = os.environ.get("RAG_API_URL", "https://promissory-alexander-measurelessly.ngrok-free.dev/rag/query")
-            headers = {"Ngrok-Skip-Browser-Warning": "true"}
-            response = requests.post(RAG_API_URL, json=payload, headers=headers, timeout=500)
-
-            if response.status_code == 200:
-                data = response.json()
+            async with get_rag_session().post(RAG_API_URL, json=payload) as response:
+                status = response.status
+                if status == 200:
+                    data = await response.json(content_type=None)
+                else:
+                    error_text = await response.text()
+
+            if status == 200:
                 logger.info(f"RAG Response Raw: {data}")
 
                 # FIXED: Use correct field names from FastAPI QueryResponse
@@ -79,7 +125,7 @@ class ActionPhi3RagAnswer(Action):
                 return answer, confidence, sources, processing_time
 
             else:
-                logger.error(f"RAG service error: {response.status_code} - {response.text}")
+                logger.error(f"RAG service error: {status} - {error_text}")
                 return (
                     "I'm having trouble connecting to my knowledge base.",
                     0.0,
@@ -87,7 +133,7 @@ class ActionPhi3RagAnswer(Action):
                     0.0
                 )
 
-        except requests.Timeout:
+        except asyncio.TimeoutError:
             logger.error("RAG service timeout")
             return (
                 "The request is taking too long. Please try again.",
@@ -95,7 +141,7 @@ class ActionPhi3RagAnswer(Action):
                 [],
                 0.0
             )
-        except requests.ConnectionError:
+        except aiohttp.ClientConnectionError:
             logger.error("RAG service connection error")
             return (
                 "I can't connect to the answer service. Please try again later.",
@@ -188,16 +234,16 @@ class ActionPhi3RagAnswer(Action):
 
         return "\n".join(reversed(history[-6:]))
 
-def call_rag_fallback(dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-    """Helper function to call RAG fallback from other actions"""
+async def call_rag_fallback(dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    """Helper function to call RAG fallback from other actions (the SDK awaits the returned coroutine)"""
     rag_action = ActionPhi3RagAnswer()
-    return rag_action.run(dispatcher, tracker, domain)
+    return await rag_action.run(dispatcher, tracker, domain)
 
 class ActionDefaultFallback(Action):
     """Fallback to RAG for unrecognized intents"""
     def name(self) -> Text:
         return "action_default_fallback"
-    def run(
+    async def run(
         self,
         dispatcher: CollectingDispatcher,
         tracker: Tracker,
@@ -207,7 +253,7 @@ class ActionDefaultFallback(Action):
         logger.info(f"Fallback triggered for: {user_message}")
         # Try RAG for unrecognized intents
         rag_action = ActionPhi3RagAnswer()
-        return rag_action.run(dispatcher, tracker, domain)
+        return await rag_action.run(dispatcher, tracker, domain)
 
 
 
@@ -220,18 +266,90 @@ class ActionDefaultFallback(Action):
 
 BASE_URL = "https://raw.githubusercontent.com/Atkiya/RasaChatbot/main/"
 
+# Keep-alive connection pool shared by every load_* call
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# Parsed JSON per filename -> (data, fetched_at); failed fetches are not cached and fall back to the expired copy.
+# KB_CACHE_TTL (seconds) lets operators pick up edited files without a restart; 0 keeps them for the process lifetime.
+KB_CACHE_TTL = float(os.environ.get("KB_CACHE_TTL", "0"))
+_JSON_CACHE = {}
+# One lock per filename so concurrent misses (e.g. the KB_PREFETCH thread and a live request) fetch a file only once
+_FETCH_LOCKS = {}
+
+def _cached_json(filename):
+    entry = _JSON_CACHE.get(filename)
+    if entry is None:
+        return None
+    data, fetched_at = entry
+    if KB_CACHE_TTL and time.monotonic() - fetched_at > KB_CACHE_TTL:
+        return None
+    return data
+
+def _stale_json(filename):
+    entry = _JSON_CACHE.get(filename)
+    return entry[0] if entry else None
+
 def load_json_file(filename):
+    cached = _cached_json(filename)
+    if cached is not None:
+        return cached
+    with _FETCH_LOCKS.setdefault(filename, threading.Lock()):
+        cached = _cached_json(filename)
+        if cached is not None:
+            return cached
+        return _fetch_json(filename)
+
+def _fetch_json(filename):
     try:
         url = BASE_URL + filename
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=15)
         if response.status_code == 200:
-            return response.json()
+            data = _json_loads(response.content)
+            _JSON_CACHE[filename] = (data, time.monotonic())
+            return data
         else:
             print(f"ERROR: Failed to fetch {filename}. Status: {response.status_code}")
-            return None
+            return _stale_json(filename)
     except Exception as e:
         print(f"ERROR loading {filename}: {str(e)}")
-        return None
+        return _stale_json(filename)
+
+# Views derived from a loaded document (indexes, rendered replies), rebuilt only when it is re-fetched.
+# Pass `key` (e.g. the filename) when the same build runs over several documents.
+_DERIVED_CACHE = {}
+
+def derived_view(data, build, key=None):
+    slot = build if key is None else (build, key)
+    cached = _DERIVED_CACHE.get(slot)
+    if cached is None or cached[0] is not data:
+        cached = (data, build(data))
+        _DERIVED_CACHE[slot] = cached
+    return cached[1]
+
+def reply_cache(data):
+    """Empty per-document dict for replies that also depend on the request (use through derived_view)"""
+    return {}
+
+def invalidate_knowledge_base(filename=None):
+    """Drop cached JSON (one file, or all of it) so the next access re-fetches; handy for hot reloads"""
+    if filename is None:
+        _JSON_CACHE.clear()
+        _DERIVED_CACHE.clear()
+    else:
+        cached = _JSON_CACHE.pop(filename, None)
+        if cached is not None:
+            for slot in [slot for slot, (data, _) in _DERIVED_CACHE.items() if data is cached[0]]:
+                del _DERIVED_CACHE[slot]
+
+def _reload_knowledge_base(signum, frame):
+    logger.info("SIGHUP received; dropping cached knowledge base files")
+    invalidate_knowledge_base()
+
+# `kill -HUP <action server pid>` picks up edited knowledge base files without a restart;
+# signal handlers can only be installed from the main thread
+if hasattr(signal, "SIGHUP") and threading.current_thread() is threading.main_thread():
+    signal.signal(signal.SIGHUP, _reload_knowledge_base)
 
 def load_admission_calendar():
     return load_json_file("dynamic_admission_calendar.json")
@@ -386,70 +504,168 @@ def load_st_sociology():
 # ========================================
 # HELPER FUNCTION TO LOAD ALL FILES
 # ========================================
-def load_all_knowledge_base():
-    """Load all JSON files at once into a dictionary"""
-    return {
-        # Dynamic files
-        "admission_calendar": load_admission_calendar(),
-        "admission_process": load_admission_process(),
-        "admission_requirements": load_admission_requirements(),
-        "tuition_fees": load_tuition_fees(),
-        "events_workshops": load_events_workshops(),
-        "faculty": load_faculty(),
-        "grading": load_grading(),
-        "facilities": load_facilities(),
-        
-        # Static files
-        "about_ewu": load_about_ewu(),
-        "admin": load_admin(),
-        "all_programs": load_all_programs(),
-        "campus_life": load_campus_life(),
-        "career_counseling": load_career_counseling(),
-        "clubs": load_clubs(),
-        "departments": load_departments(),
-        "facilities_static": load_facilities_static(),
-        "facilities17": load_facilities17(),
-        "helpdesk": load_helpdesk(),
-        "payment_procedure": load_payment_procedure(),
-        "policy": load_policy(),
-        "programs": load_programs(),
-        "rules": load_rules(),
-        "scholarships": load_scholarships(),
-        "sexual_harassment": load_sexual_harassment(),
-        "tuition_fees_static": load_tuition_fees_static(),
-        
-        # Graduate programs
-        "ma_english": load_ma_english(),
-        "mba_emba": load_mba_emba(),
-        "mds": load_mds(),
-        "mphil_pharmacy": load_mphil_pharmacy(),
-        "mss_economics": load_mss_economics(),
-        "ms_cse": load_ms_cse(),
-        "ms_dsa": load_ms_dsa(),
-        "tesol": load_tesol(),
-        
-        # Undergraduate programs
-        "st_ba": load_st_ba(),
-        "st_ce": load_st_ce(),
-        "st_cse": load_st_cse(),
-        "st_ece": load_st_ece(),
-        "st_economics": load_st_economics(),
-        "st_eee": load_st_eee(),
-        "st_english": load_st_english(),
-        "st_geb": load_st_geb(),
-        "st_information_studies": load_st_information_studies(),
-        "st_law": load_st_law(),
-        "st_math": load_st_math(),
-        "st_pharmacy": load_st_pharmacy(),
-        "st_social_relations": load_st_social_relations(),
-        "st_sociology": load_st_sociology(),
-    }
+KNOWLEDGE_BASE_FILES = {
+    "admission_calendar": "dynamic_admission_calendar.json",
+    "admission_process": "dynamic_admission_process.json",
+    "admission_requirements": "dynamic_admission_requirements.json",
+    "tuition_fees": "dynamic_tution_fees.json",
+    "events_workshops": "dynamic_events_workshops.json",
+    "faculty": "dynamic_faculty.json",
+    "grading": "dynamic_grading.json",
+    "facilities": "dynamic_facilites.json",
+    "about_ewu": "static_aboutEWU.json",
+    "admin": "static_Admin.json",
+    "all_programs": "static_AllAvailablePrograms.json",
+    "campus_life": "static_campus_life.json",
+    "career_counseling": "static_Career_Counseling_Center.json",
+    "clubs": "static_clubs.json",
+    "departments": "static_depts.json",
+    "facilities_static": "static_facilities.json",
+    "facilities17": "static_facilities17.json",
+    "helpdesk": "static_helpdesk.json",
+    "payment_procedure": "static_payment_procedure.json",
+    "policy": "static_Policy.json",
+    "programs": "static_Programs.json",
+    "rules": "static_Rules.json",
+    "scholarships": "static_scholarship_and_financial.json",
+    "sexual_harassment": "static_Sexual_harassment.json",
+    "tuition_fees_static": "static_Tuition_fees.json",
+    "ma_english": "ma_english.json",
+    "mba_emba": "mba_emba.json",
+    "mds": "mds.json",
+    "mphil_pharmacy": "mphil_pharmacy.json",
+    "mss_economics": "mss_eco.json",
+    "ms_cse": "ms_cse.json",
+    "ms_dsa": "ms_dsa.json",
+    "tesol": "tesol.json",
+    "st_ba": "st_ba.json",
+    "st_ce": "st_ce.json",
+    "st_cse": "st_cse.json",
+    "st_ece": "st_ece.json",
+    "st_economics": "st_economics.json",
+    "st_eee": "st_eee.json",
+    "st_english": "st_english.json",
+    "st_geb": "st_geb.json",
+    "st_information_studies": "st_information_studies.json",
+    "st_law": "st_law.json",
+    "st_math": "st_math.json",
+    "st_pharmacy": "st_pharmacy.json",
+    "st_social_relations": "st_social_relations.json",
+    "st_sociology": "st_sociology.json",
+}
+
+class LazyKnowledgeBase(Mapping):
+    """Read-only knowledge base view that fetches each file on first access (kb["faculty"] or kb.faculty)"""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return load_json_file(KNOWLEDGE_BASE_FILES[key])
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self):
+        return iter(KNOWLEDGE_BASE_FILES)
+
+    def __len__(self):
+        return len(KNOWLEDGE_BASE_FILES)
+
+    def prefetch(self):
+        """Warm every file up front; fetches are network-bound, so overlap them on the shared session"""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(load_json_file, KNOWLEDGE_BASE_FILES.values()))
+
+KNOWLEDGE_BASE = LazyKnowledgeBase()
 
+# KB_PREFETCH=1 warms every file in the background when the action server imports this module,
+# so the first user turn does not pay for the fetches
+if os.environ.get("KB_PREFETCH", "0") == "1":
+    threading.Thread(target=KNOWLEDGE_BASE.prefetch, name="kb-prefetch", daemon=True).start()
+
+
+# ========================================
+# TUITION FEE PROGRAM INDEX
+# ========================================
+
+# program key -> (fee section, match); same first-match semantics as the old per-action scans
+TUITION_PROGRAM_RULES = [
+    ("cse", "undergraduate_programs", lambda p: 'CSE' in p['program']),
+    ("bba", "undergraduate_programs", lambda p: p['program'] == 'BBA'),
+    ("economics", "undergraduate_programs", lambda p: 'Economics' in p['program']),
+    ("english", "undergraduate_programs", lambda p: 'English' in p['program']),
+    ("law", "undergraduate_programs", lambda p: 'LL.B' in p['program']),
+    ("sociology", "undergraduate_programs", lambda p: 'Sociology' in p['program']),
+    ("information_studies", "undergraduate_programs", lambda p: 'Information Studies' in p['program']),
+    ("ice", "undergraduate_programs", lambda p: 'ICE' in p['program'] or 'Communication' in p['program']),
+    ("eee", "undergraduate_programs", lambda p: 'EEE' in p['program']),
+    ("pharmacy", "undergraduate_programs", lambda p: 'Pharm' in p['program']),
+    ("geb", "undergraduate_programs", lambda p: 'GEB' in p['program'] or 'Genetic' in p['program']),
+    ("civil", "undergraduate_programs", lambda p: 'Civil' in p['program']),
+    ("pphs", "undergraduate_programs", lambda p: 'PPHS' in p['program'] or 'Public Health' in p['program']),
+    ("math", "undergraduate_programs", lambda p: 'Mathematics' in p['program']),
+    ("data_science", "undergraduate_programs", lambda p: 'Data Science' in p['program']),
+    ("social_relations", "undergraduate_programs", lambda p: 'Social Relations' in p['program']),
+    ("ms_data_science", "graduate_programs", lambda p: 'Data Science' in p['program'] and 'Analytics' in p['program']),
+    ("ma_english_extended", "graduate_programs", lambda p: p['program'] == 'MA in English (Extended)'),
+    ("ma_tesol_42", "graduate_programs", lambda p: p['program'] == 'MA in TESOL' and p['credits'] == 42),
+    ("ma_tesol_48", "graduate_programs", lambda p: p['program'] == 'MA in TESOL' and p['credits'] == 48),
+    ("ma_tesol_40", "graduate_programs", lambda p: p['program'] == 'MA in TESOL' and p['credits'] == 40),
+    ("ppdm", "diploma_programs", lambda p: 'PPDM' in p['program'] or 'Disaster Management' in p['program']),
+]
+
+TUITION_FIELDS = ('program', 'tuition_fees', 'credits', 'grand_total')
+
+def build_tuition_index(data):
+    """Resolve every program key to its fee record once per loaded document"""
+    # A missing section or a record without the fields the reply needs is skipped, not fatal
+    structures = {}
+    for section in {section for _, section, _ in TUITION_PROGRAM_RULES}:
+        records = (data.get(section) or {}).get('detailed_fee_structure') or []
+        structures[section] = [p for p in records
+                               if isinstance(p, Mapping) and all(p.get(field) is not None for field in TUITION_FIELDS)]
+    index = {}
+    for key, section, match in TUITION_PROGRAM_RULES:
+        prog = next((p for p in structures[section] if match(p)), None)
+        if prog:
+            index[key] = prog
+    return index
+
+def build_tuition_messages(data):
+    """Render the reply for every indexed program once per loaded document"""
+    index = derived_view(data, build_tuition_index)
+    messages = {}
+    for _, _, title, key in TUITION_ACTIONS:
+        prog = index.get(key)
+        if prog:
+            program, tuition, credits, total = (prog['program'], prog['tuition_fees'],
+                                                prog['credits'], prog['grand_total'])
+            messages[key] = (f"**{title or program}**\n\n"
+                             f" **Tuition Fee:** {tuition:,} BDT\n"
+                             f" **Total Credits:** {credits}\n"
+                             f" **Total Program Cost:** {total:,} BDT")
+    return messages
+
+def load_tuition_messages():
+    data = load_tuition_fees()
+    if not data:
+        return None
+    return derived_view(data, build_tuition_messages)
 
 # ========================================
 # TUITION FEES (UNDERGRADUATE) ACTIONS
 # ========================================
 
+PER_CREDIT_HEADER = "**East West University Tuition Fees (Per Credit)**\n\n"
+PER_CREDIT_FOOTER = "\n*Applicable from: {}*"
+
+def render_per_credit_fees(data):
+    body = "".join(f"- {program['program']}: {program['fee_per_credit']:,} BDT/credit\n"
+                   for program in data['undergraduate_programs']['tuition_fees_per_credit'])
+    return PER_CREDIT_HEADER + body + PER_CREDIT_FOOTER.format(data['page_info']['applicable_from'])
+
 class ActionGetTuitionGeneral(Action):
     def name(self) -> Text:
         return "action_tuition_general"
@@ -460,12 +676,7 @@ class ActionGetTuitionGeneral(Action):
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
         
-        message = "**East West University Tuition Fees (Per Credit)**\n\n"
-        for program in data['undergraduate_programs']['tuition_fees_per_credit']:
-            message += f"- {program['program']}: {program['fee_per_credit']:,} BDT/credit\n"
-        
-        message += f"\n*Applicable from: {data['page_info']['applicable_from']}*"
-        dispatcher.utter_message(text=message)
+        dispatcher.utter_message(text=derived_view(data, render_per_credit_fees))
         return []
 
 class ActionGetApplicationFee(Action):
@@ -483,2248 +694,1001 @@ class ActionGetApplicationFee(Action):
         dispatcher.utter_message(text=message)
         return []
 
-class ActionGetTuitionCSE(Action):
+# ========================================
+# TUITION FEES (PER PROGRAM) ACTIONS
+# ========================================
+
+# (class name, action name, reply title, program key); a title of None uses the program name from the data
+TUITION_ACTIONS = [
+    # Undergraduate
+    ("ActionGetTuitionCSE", "action_tuition_cse", "B.Sc. in Computer Science & Engineering (CSE)", "cse"),
+    ("ActionGetTuitionBBA", "action_tuition_bba", "BBA (Bachelor of Business Administration)", "bba"),
+    ("ActionGetTuitionEconomics", "action_tuition_economics", "BSS in Economics", "economics"),
+    ("ActionGetTuitionEnglish", "action_tuition_english", "BA in English", "english"),
+    ("ActionGetTuitionLaw", "action_tuition_law", "LL.B (Honours)", "law"),
+    ("ActionGetTuitionSociology", "action_tuition_sociology", "BSS in Sociology", "sociology"),
+    ("ActionGetTuitionInformationStudies", "action_tuition_information_studies", "BSS in Information Studies", "information_studies"),
+    ("ActionGetTuitionICE", "action_tuition_ice", "B.Sc. in Information & Communication Engineering (ICE)", "ice"),
+    ("ActionGetTuitionEEE", "action_tuition_eee", "B.Sc. in Electrical & Electronic Engineering (EEE)", "eee"),
+    ("ActionGetTuitionPharmacy", "action_tuition_pharmacy", "Bachelor of Pharmacy (B.Pharm)", "pharmacy"),
+    ("ActionGetTuitionGEB", "action_tuition_geb", "B.Sc. in Genetic Engineering & Biotechnology (GEB)", "geb"),
+    ("ActionGetTuitionCivil", "action_tuition_civil", "B.Sc. in Civil Engineering", "civil"),
+    ("ActionGetTuitionPPHS", "action_tuition_pphs", "BSS in Population & Public Health Sciences (PPHS)", "pphs"),
+    ("ActionGetTuitionMath", "action_tuition_math", "B.Sc. in Mathematics", "math"),
+    ("ActionGetTuitionDataScience", "action_tuition_data_science", "B.Sc. in Data Science & Analytics", "data_science"),
+    ("ActionGetTuitionSocialRelations", "action_tuition_social_relations", "BSS in Social Relations", "social_relations"),
+    # Graduate
+    ("ActionMSDataScienceFee", "action_ms_data_science_fee", "M.S. in Data Science and Analytics", "ms_data_science"),
+    ("ActionMAEnglishExtendedFee", "action_ma_english_extended_fee", "MA in English (Extended - 45 Credits)", "ma_english_extended"),
+    ("ActionMATESOL42Fee", "action_ma_tesol_42_fee", "MA in TESOL (42 Credits)", "ma_tesol_42"),
+    ("ActionMATESOL48Fee", "action_ma_tesol_48_fee", "MA in TESOL (48 Credits)", "ma_tesol_48"),
+    ("ActionMATESOL40Fee", "action_ma_tesol_40_fee", "MA in TESOL (40 Credits)", "ma_tesol_40"),
+    # Diploma
+    ("ActionPPDMDiplomaFee", "action_ppdm_diploma_fee", None, "ppdm"),
+]
+
+def make_tuition_action(class_name, action_name, key):
+    """Build the Action subclass that sends the pre-rendered fee reply for one program"""
     def name(self) -> Text:
-        return "action_tuition_cse"
-    
+        return action_name
+
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
+        messages = load_tuition_messages()
+        if not messages:
             return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'CSE' in p['program']), None)
-        if prog:
-            message = (f"**B.Sc. in Computer Science & Engineering (CSE)**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
+        message = messages.get(key)
+        if message:
             dispatcher.utter_message(text=message)
             return []
         return call_rag_fallback(dispatcher, tracker, domain)
 
-class ActionGetTuitionBBA(Action):
+    return type(class_name, (Action,), {"name": name, "run": run, "__module__": __name__})
+
+for _class_name, _action_name, _, _key in TUITION_ACTIONS:
+    globals()[_class_name] = make_tuition_action(_class_name, _action_name, _key)
+
+# Each program's intent is its action name without the "action_" prefix (tuition_cse, ma_tesol_42_fee, ...)
+TUITION_INTENT_KEYS = {action_name[len("action_"):]: key for _, action_name, _, key in TUITION_ACTIONS}
+
+class ActionGetTuitionByProgram(Action):
+    """Answers every per-program fee intent with one action"""
     def name(self) -> Text:
-        return "action_tuition_bba"
-    
+        return "action_tuition_by_program"
+
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if p['program'] == 'BBA'), None)
-        if prog:
-            message = (f"**BBA (Bachelor of Business Administration)**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
+        key = TUITION_INTENT_KEYS.get(tracker.latest_message.get("intent", {}).get("name"))
+        messages = load_tuition_messages()
+        message = messages.get(key) if messages else None
+        if message:
             dispatcher.utter_message(text=message)
             return []
         return call_rag_fallback(dispatcher, tracker, domain)
 
-class ActionGetTuitionEconomics(Action):
+# ========================================
+# COMPREHENSIVE TUITION BREAKDOWN (ALL PROGRAMS)
+# ========================================
+
+# (fee section, heading) in the order they appear in the complete structure reply
+TUITION_STRUCTURE_SECTIONS = [
+    ("undergraduate_programs", "**UNDERGRADUATE PROGRAMS** (15 programs)\n"),
+    ("graduate_programs", "\n**GRADUATE PROGRAMS** (13 programs)\n"),
+    ("diploma_programs", "\n**DIPLOMA PROGRAMS** (1 program)\n"),
+]
+
+def render_complete_tuition(data):
+    parts = ["**Complete Tuition Fee Structure at EWU**\n\n"]
+    for section, heading in TUITION_STRUCTURE_SECTIONS:
+        parts.append(heading)
+        parts.extend(f"- {prog['program']}: {prog['grand_total']:,} BDT (Total)\n"
+                     for prog in data[section]['detailed_fee_structure'])
+    return "".join(parts)
+
+class ActionCompleteTuitionStructure(Action):
     def name(self) -> Text:
-        return "action_tuition_economics"
+        return "action_complete_tuition_structure"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         data = load_tuition_fees()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'Economics' in p['program']), None)
-        if prog:
-            message = (f"**BSS in Economics**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        
+        dispatcher.utter_message(text=derived_view(data, render_complete_tuition))
+        return []
+
+
+# ========================================
+# TUITION FEES (GRADUATE) ACTIONS
+# ========================================
+
+# (class name, action name, reply); these programs have no fee data, so the reply points to admissions
+STATIC_FEE_ACTIONS = [
+    ("ActionMBAFee", "action_mba_fee",
+     "**MBA Program Fee**\n\nFor detailed MBA tuition information, please contact the admissions office at admissions@ewubd.edu or call 09666775577."),
+    ("ActionEMBAFee", "action_emba_fee",
+     "**Executive MBA (EMBA) Program Fee**\n\nFor detailed EMBA tuition information, please contact the admissions office at admissions@ewubd.edu or call 09666775577."),
+    ("ActionMDSFee", "action_mds_fee",
+     "**Master in Development Studies (MDS) Program Fee**\n\nFor detailed MDS tuition information, please contact admissions."),
+    ("ActionMSSEconomicsFee", "action_mss_economics_fee",
+     "**MSS in Economics Program Fee**\n\nFor detailed MSS Economics tuition information, please contact admissions."),
+    ("ActionMAEnglishFee", "action_ma_english_fee",
+     "**MA in English Program Fee**\n\nFor detailed MA English tuition information, please contact admissions."),
+    ("ActionMATESOLFee", "action_ma_tesol_fee",
+     "**MA in TESOL Program Fee**\n\nFor detailed MA TESOL tuition information, please contact admissions."),
+    ("ActionLLMFee", "action_llm_fee",
+     "**Master of Laws (LL.M.) Program Fee**\n\nFor detailed LL.M tuition information, please contact admissions."),
+    ("ActionMPRHGDFee", "action_mprhgd_fee",
+     "**MPRHGD Program Fee**\n\nFor detailed MPRHGD tuition information, please contact admissions."),
+    ("ActionDSAnalyticsFee", "action_ds_analytics_fee",
+     "**MS Data Science & Analytics Program Fee**\n\nFor detailed MS Data Science tuition information, please contact admissions."),
+    ("ActionMSCSEFee", "action_ms_cse_fee",
+     "**MS in Computer Science & Engineering (MS CSE) Program Fee**\n\nFor detailed MS CSE tuition information, please contact admissions."),
+    ("ActionMPharmFee", "action_mpharm_fee",
+     "**M.Pharm Program Fee**\n\nFor detailed M.Pharm tuition information, please contact admissions."),
+    ("ActionPGDEDFee", "action_pgded_fee",
+     "**PGDED (Post Graduate Diploma in Entrepreneurship Development) Program Fee**\n\nFor detailed PGDED tuition information, please contact admissions."),
+    ("ActionPPDMFee", "action_ppdm_fee",
+     "**PPDM (Post Graduate Diploma in Population, Public Health and Disaster Management) Program Fee**\n\nFor detailed PPDM tuition information, please contact admissions."),
+]
+
+def make_static_reply_action(class_name, action_name, message):
+    """Build an Action subclass that always sends the same reply"""
+    def name(self) -> Text:
+        return action_name
 
-class ActionGetTuitionEnglish(Action):
-    def name(self) -> Text:
-        return "action_tuition_english"
-    
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'English' in p['program']), None)
+        dispatcher.utter_message(text=message)
+        return []
+
+    return type(class_name, (Action,), {"name": name, "run": run, "__module__": __name__})
+
+for _class_name, _action_name, _message in STATIC_FEE_ACTIONS:
+    globals()[_class_name] = make_static_reply_action(_class_name, _action_name, _message)
+
+# ========================================
+# ADMISSION CALENDAR PROGRAM INDEX
+# ========================================
+
+# program key -> (calendar section, match); each key takes the first record its rule matches
+ADMISSION_PROGRAM_RULES = [
+    ("cse", "undergraduate_admission", lambda p: 'CSE' in p['program']),
+    ("bba", "undergraduate_admission", lambda p: 'BBA' in p['program']),
+    ("economics", "undergraduate_admission", lambda p: 'Economics' in p['program']),
+    ("english", "undergraduate_admission", lambda p: 'English' in p['program']),
+    ("law", "undergraduate_admission", lambda p: 'LLB' in p['program'] or 'Law' in p['program']),
+    ("sociology", "undergraduate_admission", lambda p: 'Sociology' in p['program']),
+    ("information_studies", "undergraduate_admission", lambda p: 'Information Studies' in p['program']),
+    ("pphs", "undergraduate_admission", lambda p: 'Public Health' in p['program'] or 'PPHS' in p['program']),
+    ("ice", "undergraduate_admission", lambda p: 'ICE' in p['program']),
+    ("eee", "undergraduate_admission", lambda p: 'EEE' in p['program']),
+    ("pharmacy", "undergraduate_admission", lambda p: 'Pharmacy' in p['program']),
+    ("geb", "undergraduate_admission", lambda p: 'Genetic' in p['program'] or 'Biotechnology' in p['program']),
+    ("civil", "undergraduate_admission", lambda p: 'Civil' in p['program']),
+    ("math", "undergraduate_admission", lambda p: 'Mathematics' in p['program']),
+    ("data_science", "undergraduate_admission", lambda p: 'Data Science' in p['program']),
+    ("mba", "graduate_admission", lambda p: 'MBA' in p['program'] and 'Executive' not in p['program']),
+    ("emba", "graduate_admission", lambda p: 'Executive MBA' in p['program'] or 'EMBA' in p['program']),
+    ("mds", "graduate_admission", lambda p: 'MDS' in p['program']),
+    ("mss_economics", "graduate_admission", lambda p: 'MSS' in p['program'] and 'Economics' in p['program']),
+    ("ma_english", "graduate_admission", lambda p: 'MA in English' in p['program']),
+    ("ma_tesol", "graduate_admission", lambda p: 'TESOL' in p['program']),
+    ("mprhgd", "graduate_admission", lambda p: 'MPRHGD' in p['program']),
+    ("llm", "graduate_admission", lambda p: 'LLM' in p['program']),
+    ("ms_cse", "graduate_admission", lambda p: 'MS in CSE' in p['program']),
+    ("ms_data_science", "graduate_admission", lambda p: 'Data Science' in p['program']),
+    ("mpharm", "graduate_admission", lambda p: 'Master of Pharmacy' in p['program']),
+    ("ppdm", "graduate_admission", lambda p: 'PPDM' in p['program']),
+]
+
+def build_admission_index(data):
+    """Resolve every program key to its admission calendar record once per loaded document"""
+    # A missing section or a record without a program name is skipped, not fatal
+    records = {section: [p for p in data.get(section) or [] if isinstance(p, Mapping) and p.get('program')]
+               for section in {section for _, section, _ in ADMISSION_PROGRAM_RULES}}
+    index = {}
+    for key, section, match in ADMISSION_PROGRAM_RULES:
+        prog = next((p for p in records[section] if match(p)), None)
         if prog:
-            message = (f"**BA in English**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+            index[key] = prog
+    return index
+
+def load_admission_index():
+    data = load_admission_calendar()
+    if not data:
+        return None
+    return derived_view(data, build_admission_index)
+
+# ========================================
+# ADMISSION DEADLINES
+# ========================================
+
+def render_deadline_overview(data):
+    page_info = data['page_info']
+    parts = [f"**{page_info['semester']} Admission Deadlines**\n\n", "** Undergraduate Programs:**\n"]
+    parts.extend(f"• {program['program']}: {program['application_deadline']}\n"
+                 for program in data['undergraduate_admission'])
+    parts.append("\n** Graduate Programs:**\n")
+    parts.extend(f"• {program['program']}: {program['application_deadline']}\n"
+                 for program in data['graduate_admission'])
+    parts.append(f"\n*{page_info['disclaimer']}*")
+    return "".join(parts)
 
-class ActionGetTuitionLaw(Action):
+class ActionAdmissionDeadlineGeneral(Action):
     def name(self) -> Text:
-        return "action_tuition_law"
+        return "action_admission_deadline_general"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
+        data = load_admission_calendar()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'LL.B' in p['program']), None)
+        
+        dispatcher.utter_message(text=derived_view(data, render_deadline_overview))
+        return []
+
+
+# Reply layouts, filled straight from the calendar record; CSE and BBA spell out the field names
+DEADLINE_TEMPLATES = {
+    "full": "**{program}**\n\n📅 **Application Deadline:** {application_deadline}\n📝 **Test Date:** {admission_test}",
+    "short": "**{program}**\n\n📅 **Deadline:** {application_deadline}\n📝 **Test:** {admission_test}",
+}
+
+# (class name, action name, program key, reply layout)
+ADMISSION_DEADLINE_ACTIONS = [
+    # Undergraduate
+    ("ActionAdmissionDeadlineCSE", "action_admission_deadline_cse", "cse", "full"),
+    ("ActionAdmissionDeadlineBBA", "action_admission_deadline_bba", "bba", "full"),
+    ("ActionAdmissionDeadlineEconomics", "action_admission_deadline_economics", "economics", "short"),
+    ("ActionAdmissionDeadlineEnglish", "action_admission_deadline_english", "english", "short"),
+    ("ActionAdmissionDeadlineLaw", "action_admission_deadline_law", "law", "short"),
+    ("ActionAdmissionDeadlineSociology", "action_admission_deadline_sociology", "sociology", "short"),
+    ("ActionAdmissionDeadlineInformationStudies", "action_admission_deadline_information_studies", "information_studies", "short"),
+    ("ActionAdmissionDeadlinePPHS", "action_admission_deadline_pphs", "pphs", "short"),
+    ("ActionAdmissionDeadlineICE", "action_admission_deadline_ice", "ice", "short"),
+    ("ActionAdmissionDeadlineEEE", "action_admission_deadline_eee", "eee", "short"),
+    ("ActionAdmissionDeadlinePharmacy", "action_admission_deadline_pharmacy", "pharmacy", "short"),
+    ("ActionAdmissionDeadlineGEB", "action_admission_deadline_geb", "geb", "short"),
+    ("ActionAdmissionDeadlineCivil", "action_admission_deadline_civil", "civil", "short"),
+    ("ActionAdmissionDeadlineMath", "action_admission_deadline_math", "math", "short"),
+    ("ActionAdmissionDeadlineDataScience", "action_admission_deadline_data_science", "data_science", "short"),
+    # Graduate
+    ("ActionAdmissionDeadlineMBA", "action_admission_deadline_mba", "mba", "short"),
+    ("ActionAdmissionDeadlineEMBA", "action_admission_deadline_emba", "emba", "short"),
+    ("ActionAdmissionDeadlineMDS", "action_admission_deadline_mds", "mds", "short"),
+    ("ActionAdmissionDeadlineMSSEconomics", "action_admission_deadline_mss_economics", "mss_economics", "short"),
+    ("ActionAdmissionDeadlineMAEnglish", "action_admission_deadline_ma_english", "ma_english", "short"),
+    ("ActionAdmissionDeadlineMATESOL", "action_admission_deadline_ma_tesol", "ma_tesol", "short"),
+    ("ActionAdmissionDeadlineMPRHGD", "action_admission_deadline_mprhgd", "mprhgd", "short"),
+    ("ActionAdmissionDeadlineLLM", "action_admission_deadline_llm", "llm", "short"),
+    ("ActionAdmissionDeadlineMSCSE", "action_admission_deadline_ms_cse", "ms_cse", "short"),
+    ("ActionAdmissionDeadlineMSDataScience", "action_admission_deadline_ms_data_science", "ms_data_science", "short"),
+    ("ActionAdmissionDeadlineMPharm", "action_admission_deadline_mpharm", "mpharm", "short"),
+    ("ActionAdmissionDeadlinePPDM", "action_admission_deadline_ppdm", "ppdm", "short"),
+]
+
+def build_deadline_messages(data):
+    """Render the deadline reply for every indexed program once per loaded calendar"""
+    index = derived_view(data, build_admission_index)
+    messages = {}
+    for _, _, key, layout in ADMISSION_DEADLINE_ACTIONS:
+        prog = index.get(key)
         if prog:
-            message = (f"**LL.B (Honours)**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+            # A record missing a template field is skipped, so that program falls back instead of breaking the rest
+            try:
+                messages[key] = DEADLINE_TEMPLATES[layout].format_map(prog)
+            except KeyError as e:
+                logger.warning(f"Admission calendar entry for {key} is missing {e}")
+    return messages
+
+def load_deadline_messages():
+    data = load_admission_calendar()
+    if not data:
+        return None
+    return derived_view(data, build_deadline_messages)
 
-class ActionGetTuitionSociology(Action):
+def make_deadline_action(class_name, action_name, key):
+    """Build the Action subclass that sends the pre-rendered deadline reply for one program"""
     def name(self) -> Text:
-        return "action_tuition_sociology"
-    
+        return action_name
+
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
+        messages = load_deadline_messages()
+        if not messages:
             return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'Sociology' in p['program']), None)
-        if prog:
-            message = (f"**BSS in Sociology**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
+        message = messages.get(key)
+        if message:
             dispatcher.utter_message(text=message)
             return []
         return call_rag_fallback(dispatcher, tracker, domain)
 
-class ActionGetTuitionInformationStudies(Action):
+    return type(class_name, (Action,), {"name": name, "run": run, "__module__": __name__})
+
+for _class_name, _action_name, _key, _ in ADMISSION_DEADLINE_ACTIONS:
+    globals()[_class_name] = make_deadline_action(_class_name, _action_name, _key)
+
+# ========================================
+# ADMISSION TEST DATES
+# ========================================
+
+TEST_DATE_OVERVIEW = ("**Admission Test Dates at EWU**\n\n"
+                      "**Engineering/Science Programs:** Aug 30, 2025 at 2:30 PM\n"
+                      "**Business/Arts Programs:** Aug 30, 2025 at 10:00 AM\n\n"
+                      "*For specific program test dates, please ask about your desired program.*")
+
+class ActionAdmissionTestDateGeneral(Action):
     def name(self) -> Text:
-        return "action_tuition_information_studies"
+        return "action_admission_test_date_general"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'Information Studies' in p['program']), None)
-        if prog:
-            message = (f"**BSS in Information Studies**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        dispatcher.utter_message(text=TEST_DATE_OVERVIEW)
+        return []
 
-class ActionGetTuitionICE(Action):
+# (class name, action name, reply title, calendar program key)
+ADMISSION_TEST_DATE_ACTIONS = [
+    ("ActionAdmissionTestDateCSE", "action_admission_test_date_cse", "Computer Science & Engineering (CSE)", "cse"),
+    ("ActionAdmissionTestDateBBA", "action_admission_test_date_bba", "BBA", "bba"),
+    ("ActionAdmissionTestDateMBA", "action_admission_test_date_mba", "MBA", "mba"),
+]
+
+def make_test_date_action(class_name, action_name, title, key):
+    """Build the Action subclass that answers the admission test question for one indexed program"""
     def name(self) -> Text:
-        return "action_tuition_ice"
-    
+        return action_name
+
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
+        index = load_admission_index()
+        if not index:
             return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'ICE' in p['program'] or 'Communication' in p['program']), None)
+        prog = index.get(key)
         if prog:
-            message = (f"**B.Sc. in Information & Communication Engineering (ICE)**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
+            message = (f"**{title} Admission Test**\n\n"
+                       f" **Test:** {prog['admission_test']}\n"
+                       f" **Apply by:** {prog['application_deadline']}")
             dispatcher.utter_message(text=message)
             return []
         return call_rag_fallback(dispatcher, tracker, domain)
 
-class ActionGetTuitionEEE(Action):
+    return type(class_name, (Action,), {"name": name, "run": run, "__module__": __name__})
+
+for _class_name, _action_name, _title, _key in ADMISSION_TEST_DATE_ACTIONS:
+    globals()[_class_name] = make_test_date_action(_class_name, _action_name, _title, _key)
+
+# ========================================
+# ADMISSION REQUIREMENTS ACTIONS
+# ========================================
+
+def render_requirements_general(data):
+    ug = data['admission_requirements']['undergraduate']['general_programs_except_bpharm']
+    weightage = ug['admission_test']['weightage']
+    return "".join([
+        "**Undergraduate Admission Requirements at EWU**\n\n",
+        f" **SSC & HSC:** {ug['ssc_hsc']}\n",
+        f" **Diploma:** {ug['diploma']}\n",
+        f" **O/A Levels:** {ug['o_a_levels']['requirement']}\n\n",
+        "**Admission Test Weightage:**\n",
+        f"- Admission Test: {weightage['admission_test']}\n",
+        f"- SSC/O Level: {weightage['ssc_o_level']}\n",
+        f"- HSC/A Level: {weightage['hsc_a_level']}",
+    ])
+
+class ActionAdmissionRequirementsGeneral(Action):
     def name(self) -> Text:
-        return "action_tuition_eee"
+        return "action_admission_requirements_general"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
+        data = load_admission_requirements()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'EEE' in p['program']), None)
-        if prog:
-            message = (f"**B.Sc. in Electrical & Electronic Engineering (EEE)**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        
+        dispatcher.utter_message(text=derived_view(data, render_requirements_general))
+        return []
 
-class ActionGetTuitionPharmacy(Action):
+def render_requirements_cse(data):
+    ug = data['admission_requirements']['undergraduate']['general_programs_except_bpharm']
+    cse_req = ug['subject_requirements']['cse']
+    weightage = ug['admission_test']['weightage']
+    return "".join([
+        "**B.Sc. in CSE Admission Requirements**\n\n",
+        f" **Academic:** {ug['ssc_hsc']}\n",
+        f" **Subject Requirements:** {cse_req}\n\n",
+        "**Test Weightage:**\n",
+        f"- Admission Test: {weightage['admission_test']}\n",
+        f"- SSC: {weightage['ssc_o_level']}\n",
+        f"- HSC: {weightage['hsc_a_level']}",
+    ])
+
+class ActionAdmissionRequirementsCSE(Action):
     def name(self) -> Text:
-        return "action_tuition_pharmacy"
+        return "action_admission_requirements_cse"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
+        data = load_admission_requirements()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'Pharm' in p['program']), None)
-        if prog:
-            message = (f"**Bachelor of Pharmacy (B.Pharm)**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        
+        dispatcher.utter_message(text=derived_view(data, render_requirements_cse))
+        return []
+
+def render_requirements_pharmacy(data):
+    pharm = data['admission_requirements']['undergraduate']['bpharm']
+    subject_gpa = pharm['subject_gpa']
+    return "".join([
+        "**B.Pharm Admission Requirements**\n\n",
+        f"🇧🇩 **Citizenship:** {pharm['citizenship']}\n",
+        f" **GPA:** {pharm['ssc_hsc']['aggregate']}\n",
+        f" **Each Exam:** {pharm['ssc_hsc']['minimum_each']}\n\n",
+        "**Subject Requirements (Minimum GPA):**\n",
+        f"- Chemistry: {subject_gpa['chemistry']}\n",
+        f"- Biology: {subject_gpa['biology']}\n",
+        f"- Physics: {subject_gpa['physics']}\n",
+        f"- Mathematics: {subject_gpa['mathematics']}\n\n",
+        f" {pharm['special_note']}\n",
+        f" {pharm['year_of_pass']}",
+    ])
 
-class ActionGetTuitionGEB(Action):
+class ActionAdmissionRequirementsPharmacy(Action):
     def name(self) -> Text:
-        return "action_tuition_geb"
+        return "action_admission_requirements_pharmacy"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
+        data = load_admission_requirements()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'GEB' in p['program'] or 'Genetic' in p['program']), None)
-        if prog:
-            message = (f"**B.Sc. in Genetic Engineering & Biotechnology (GEB)**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        
+        dispatcher.utter_message(text=derived_view(data, render_requirements_pharmacy))
+        return []
 
-class ActionGetTuitionCivil(Action):
+def render_requirements_mba(data):
+    mba = data['admission_requirements']['graduate']['mba_emba']
+    exemptions = mba['test_exemptions']
+    return "".join([
+        "**MBA Admission Requirements**\n\n",
+        f" **Degree:** {mba['degree']}\n",
+        f" *SSC & HSC:** {mba['ssc_hsc_gpa']}\n",
+        f"💼 **Work Experience:** {mba['mba']['work_experience']}\n\n",
+        "**Test Exemptions:**\n",
+        f"- EWU Graduates: {exemptions['ewu_graduates']}\n",
+        f"- Other Universities: {exemptions['other_universities']}",
+    ])
+
+class ActionAdmissionRequirementsMBA(Action):
     def name(self) -> Text:
-        return "action_tuition_civil"
+        return "action_admission_requirements_mba"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
+        data = load_admission_requirements()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'Civil' in p['program']), None)
-        if prog:
-            message = (f"**B.Sc. in Civil Engineering**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        
+        dispatcher.utter_message(text=derived_view(data, render_requirements_mba))
+        return []
+
+# ============================================================================
+# MISSING ADMISSION PROCESS ACTION FUNCTIONS
+# ============================================================================
+
+def render_application_steps(data):
+    """Walk the nested step details once per admission process document"""
+    app_section = data.get('admission_process', {}).get('application', {})
+    parts = ["** EWU Admission Application - 11 Steps**\n\n"]
+    
+    # Website links
+    parts.append("** Admission Websites:**\n")
+    parts.extend(f"- {link}\n" for link in app_section.get('website_links', []))
+    
+    # Browser recommendations
+    browsers = app_section.get('browser_recommendation', [])
+    parts.append(f"\n** Recommended Browsers:** {', '.join(browsers)}\n\n")
+    
+    # Application steps
+    parts.append("** Application Steps:**\n\n")
+    for step_info in app_section.get('steps', []):
+        step_num = step_info.get('step', '')
+        action = step_info.get('action', '')
+        details = step_info.get('details', '')
+        
+        parts.append(f"**Step {step_num}: {action}**\n")
+        
+        if isinstance(details, dict):
+            for key, value in details.items():
+                if isinstance(value, list):
+                    parts.append(f"- **{key}:** \n")
+                    parts.extend(f"  • {item}\n" for item in value)
+                else:
+                    parts.append(f"- **{key}:** {value}\n")
+        elif isinstance(details, list):
+            parts.extend(f"- {detail}\n" for detail in details)
+        else:
+            parts.append(f"{details}\n")
+        parts.append("\n")
+    return "".join(parts)
 
-class ActionGetTuitionPPHS(Action):
+class ActionAdmissionApplicationSteps(Action):
+    """Display all 11 application steps for admission"""
     def name(self) -> Text:
-        return "action_tuition_pphs"
+        return "action_admission_application_steps"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
+        data = load_admission_process()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'PPHS' in p['program'] or 'Public Health' in p['program']), None)
-        if prog:
-            message = (f"**BSS in Population & Public Health Sciences (PPHS)**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        
+        dispatcher.utter_message(text=derived_view(data, render_application_steps))
+        return []
 
-class ActionGetTuitionMath(Action):
+
+def render_admission_contact(data):
+    admission = data.get('admission_process', {})
+    contacts = admission.get('contacts', {})
+    admission_office = contacts.get('admission_office', {})
+    support = contacts.get('support', {})
+    registrar = admission.get('registrar', {})
+    
+    parts = ["** EWU Admission Contact Information**\n\n"]
+    
+    # Admission Office
+    parts.append("** Admission Office**\n")
+    parts.append(f" Address: {admission_office.get('address', 'N/A')}\n\n")
+    parts.append("** Phone Numbers:**\n")
+    parts.extend(f"- {phone}\n" for phone in admission_office.get('phone', []))
+    parts.append(f"Email: {admission_office.get('email', 'N/A')}\n\n")
+    
+    # Support Contacts
+    parts.append("** Support Contacts:**\n")
+    parts.append(f" Payment Issues: {support.get('payment_issues', 'N/A')}\n")
+    parts.append(f" Technical Issues: {support.get('technical_issues', 'N/A')}\n")
+    parts.append(f" Advising/Courses: {support.get('advising_or_course_issues', 'N/A')}\n\n")
+    
+    # Registrar
+    parts.append("** Registrar**\n")
+    parts.append(f"- {registrar.get('name', 'N/A')}\n")
+    parts.append(f"- {registrar.get('designation', 'N/A')}\n")
+    parts.append(f"- {registrar.get('university', 'N/A')}")
+    return "".join(parts)
+
+class ActionAdmissionContact(Action):
+    """Display admission office contact information"""
     def name(self) -> Text:
-        return "action_tuition_math"
+        return "action_admission_contact"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
+        data = load_admission_process()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'Mathematics' in p['program']), None)
-        if prog:
-            message = (f"**B.Sc. in Mathematics**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        
+        dispatcher.utter_message(text=derived_view(data, render_admission_contact))
+        return []
+
+
+def render_g_suite_activation(data):
+    g_suite = data.get('admission_process', {}).get('post_admission', {}).get('g_suite_activation', {})
+    
+    parts = [
+        "** EWU G Suite Email Activation**\n\n",
+        f"** Important Note:** {g_suite.get('note', 'N/A')}\n\n",
+        f"** Portal Link:** {g_suite.get('link', 'N/A')}\n\n",
+        "**Step-by-Step Instructions:**\n",
+    ]
+    parts.extend(f"{i}. {instruction}\n" for i, instruction in enumerate(g_suite.get('instructions', []), 1))
+    return "".join(parts)
 
-class ActionGetTuitionDataScience(Action):
+class ActionPostAdmissionGSuite(Action):
+    """Display G Suite email activation instructions"""
     def name(self) -> Text:
-        return "action_tuition_data_science"
+        return "action_post_admission_g_suite"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
+        data = load_admission_process()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'Data Science' in p['program']), None)
-        if prog:
-            message = (f"**B.Sc. in Data Science & Analytics**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        
+        dispatcher.utter_message(text=derived_view(data, render_g_suite_activation))
+        return []
+
+DOCUMENT_UPLOAD_NOTE = ("\n** Important Note:**\n"
+                        "• Bring both original documents and photocopies\n"
+                        "• Original documents will be returned after verification\n"
+                        "• Make sure all documents are complete and properly attested\n")
 
-class ActionGetTuitionSocialRelations(Action):
+def render_required_documents(data):
+    """None when the requirements document lists no required documents"""
+    required_docs = data.get('admission_requirements', {}).get('required_documents', [])
+    if not required_docs:
+        return None
+    parts = [
+        "** Required Documents for Admission**\n\n",
+        f"**University:** {data.get('university', 'East West University')}\n\n",
+        "** Documents You Need to Bring:**\n\n",
+    ]
+    parts.extend(f"{i}. {doc}\n" for i, doc in enumerate(required_docs, 1))
+    parts.append(DOCUMENT_UPLOAD_NOTE)
+    return "".join(parts)
+
+class ActionPostAdmissionDocumentUpload(Action):
+    """Display document upload requirements"""
     def name(self) -> Text:
-        return "action_tuition_social_relations"
+        return "action_post_admission_document_upload"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_programs']['detailed_fee_structure']
-                    if 'Social Relations' in p['program']), None)
-        if prog:
-            message = (f"**BSS in Social Relations**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-    
-# ========================================
-# MISSING TUITION FEES (GRADUATE) ACTIONS
-# ========================================
-
-class ActionMSDataScienceFee(Action):
-    def name(self) -> Text:
-        return "action_ms_data_science_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        prog = next((p for p in data['graduate_programs']['detailed_fee_structure']
-                    if 'Data Science' in p['program'] and 'Analytics' in p['program']), None)
-        if prog:
-            message = (f"**M.S. in Data Science and Analytics**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-# ========================================
-# MISSING GRADUATE PROGRAM ACTIONS
-# ========================================
-
-class ActionMAEnglishExtendedFee(Action):
-    def name(self) -> Text:
-        return "action_ma_english_extended_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        prog = next((p for p in data['graduate_programs']['detailed_fee_structure']
-                    if p['program'] == 'MA in English (Extended)'), None)
-        if prog:
-            message = (f"**MA in English (Extended - 45 Credits)**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionMATESOL42Fee(Action):
-    def name(self) -> Text:
-        return "action_ma_tesol_42_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
         
-        prog = next((p for p in data['graduate_programs']['detailed_fee_structure']
-                    if p['program'] == 'MA in TESOL' and p['credits'] == 42), None)
-        if prog:
-            message = (f"**MA in TESOL (42 Credits)**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionMATESOL48Fee(Action):
-    def name(self) -> Text:
-        return "action_ma_tesol_48_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
+        data = load_admission_requirements()
         
-        prog = next((p for p in data['graduate_programs']['detailed_fee_structure']
-                    if p['program'] == 'MA in TESOL' and p['credits'] == 48), None)
-        if prog:
-            message = (f"**MA in TESOL (48 Credits)**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionMATESOL40Fee(Action):
-    def name(self) -> Text:
-        return "action_ma_tesol_40_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
         
-        prog = next((p for p in data['graduate_programs']['detailed_fee_structure']
-                    if p['program'] == 'MA in TESOL' and p['credits'] == 40), None)
-        if prog:
-            message = (f"**MA in TESOL (40 Credits)**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-# ========================================
-# DIPLOMA PROGRAMS ACTIONS
-# ========================================
-
-class ActionPPDMDiplomaFee(Action):
-    def name(self) -> Text:
-        return "action_ppdm_diploma_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
+        message = derived_view(data, render_required_documents)
         
-        prog = next((p for p in data['diploma_programs']['detailed_fee_structure']
-                    if 'PPDM' in p['program'] or 'Disaster Management' in p['program']), None)
-        if prog:
-            message = (f"**{prog['program']}**\n\n"
-                      f" **Tuition Fee:** {prog['tuition_fees']:,} BDT\n"
-                      f" **Total Credits:** {prog['credits']}\n"
-                      f" **Total Program Cost:** {prog['grand_total']:,} BDT")
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-# ========================================
-# COMPREHENSIVE TUITION BREAKDOWN (ALL PROGRAMS)
-# ========================================
-
-class ActionCompleteTuitionStructure(Action):
-    def name(self) -> Text:
-        return "action_complete_tuition_structure"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_tuition_fees()
-        if not data:
+        if not message:
             return call_rag_fallback(dispatcher, tracker, domain)
         
-        message = "**Complete Tuition Fee Structure at EWU**\n\n"
-        message += "**UNDERGRADUATE PROGRAMS** (15 programs)\n"
-        for prog in data['undergraduate_programs']['detailed_fee_structure']:
-            message += f"- {prog['program']}: {prog['grand_total']:,} BDT (Total)\n"
-        
-        message += "\n**GRADUATE PROGRAMS** (13 programs)\n"
-        for prog in data['graduate_programs']['detailed_fee_structure']:
-            message += f"- {prog['program']}: {prog['grand_total']:,} BDT (Total)\n"
-        
-        message += "\n**DIPLOMA PROGRAMS** (1 program)\n"
-        for prog in data['diploma_programs']['detailed_fee_structure']:
-            message += f"- {prog['program']}: {prog['grand_total']:,} BDT (Total)\n"
-        
         dispatcher.utter_message(text=message)
         return []
 
 
-# ========================================
-# TUITION FEES (GRADUATE) ACTIONS
-# ========================================
-
-class ActionMBAFee(Action):
-    def name(self) -> Text:
-        return "action_mba_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**MBA Program Fee**\n\nFor detailed MBA tuition information, please contact the admissions office at admissions@ewubd.edu or call 09666775577.")
-        return []
-
-class ActionEMBAFee(Action):
-    def name(self) -> Text:
-        return "action_emba_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**Executive MBA (EMBA) Program Fee**\n\nFor detailed EMBA tuition information, please contact the admissions office at admissions@ewubd.edu or call 09666775577.")
-        return []
-
-class ActionMDSFee(Action):
-    def name(self) -> Text:
-        return "action_mds_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**Master in Development Studies (MDS) Program Fee**\n\nFor detailed MDS tuition information, please contact admissions.")
-        return []
-
-class ActionMSSEconomicsFee(Action):
-    def name(self) -> Text:
-        return "action_mss_economics_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**MSS in Economics Program Fee**\n\nFor detailed MSS Economics tuition information, please contact admissions.")
-        return []
-
-class ActionMAEnglishFee(Action):
-    def name(self) -> Text:
-        return "action_ma_english_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**MA in English Program Fee**\n\nFor detailed MA English tuition information, please contact admissions.")
-        return []
-
-class ActionMATESOLFee(Action):
-    def name(self) -> Text:
-        return "action_ma_tesol_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**MA in TESOL Program Fee**\n\nFor detailed MA TESOL tuition information, please contact admissions.")
-        return []
-
-class ActionLLMFee(Action):
-    def name(self) -> Text:
-        return "action_llm_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**Master of Laws (LL.M.) Program Fee**\n\nFor detailed LL.M tuition information, please contact admissions.")
-        return []
-
-class ActionMPRHGDFee(Action):
-    def name(self) -> Text:
-        return "action_mprhgd_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**MPRHGD Program Fee**\n\nFor detailed MPRHGD tuition information, please contact admissions.")
-        return []
-
-class ActionDSAnalyticsFee(Action):
-    def name(self) -> Text:
-        return "action_ds_analytics_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**MS Data Science & Analytics Program Fee**\n\nFor detailed MS Data Science tuition information, please contact admissions.")
-        return []
-
-class ActionMSCSEFee(Action):
-    def name(self) -> Text:
-        return "action_ms_cse_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**MS in Computer Science & Engineering (MS CSE) Program Fee**\n\nFor detailed MS CSE tuition information, please contact admissions.")
-        return []
-
-class ActionMPharmFee(Action):
-    def name(self) -> Text:
-        return "action_mpharm_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**M.Pharm Program Fee**\n\nFor detailed M.Pharm tuition information, please contact admissions.")
-        return []
 
-class ActionPGDEDFee(Action):
-    def name(self) -> Text:
-        return "action_pgded_fee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**PGDED (Post Graduate Diploma in Entrepreneurship Development) Program Fee**\n\nFor detailed PGDED tuition information, please contact admissions.")
-        return []
 
-class ActionPPDMFee(Action):
-    def name(self) -> Text:
-        return "action_ppdm_fee"
+def render_advising_slip(data):
+    advising = data.get('admission_process', {}).get('post_admission', {}).get('advising_slip', {})
     
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        dispatcher.utter_message(text="**PPDM (Post Graduate Diploma in Population, Public Health and Disaster Management) Program Fee**\n\nFor detailed PPDM tuition information, please contact admissions.")
-        return []
-
-# ========================================
-# ADMISSION DEADLINES
-# ========================================
+    parts = [
+        "** Advising Slip Access**\n\n",
+        f"**Purpose:** {advising.get('purpose', 'N/A')}\n\n",
+        "**How to Access (4 Steps):**\n",
+    ]
+    parts.extend(f"{i}. {instruction}\n" for i, instruction in enumerate(advising.get('instructions', []), 1))
+    parts.append(f"\n**Academic Calendar:** {advising.get('academic_calendar_link', 'N/A')}")
+    return "".join(parts)
 
-class ActionAdmissionDeadlineGeneral(Action):
+class ActionPostAdmissionAdvisingSlip(Action):
+    """Display advising slip access information"""
     def name(self) -> Text:
-        return "action_admission_deadline_general"
+        return "action_post_admission_advising_slip"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
+        data = load_admission_process()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
         
-        # Build header message
-        message = f"**{data['page_info']['semester']} Admission Deadlines**\n\n"
-        
-        # Undergraduate Programs Section
-        message += "** Undergraduate Programs:**\n"
-        for program in data['undergraduate_admission']:
-            prog_name = program['program']
-            deadline = program['application_deadline']
-            message += f"• {prog_name}: {deadline}\n"
-        
-        # Graduate Programs Section
-        message += "\n** Graduate Programs:**\n"
-        for program in data['graduate_admission']:
-            prog_name = program['program']
-            deadline = program['application_deadline']
-            message += f"• {prog_name}: {deadline}\n"
-        
-        # Footer note
-        message += f"\n*{data['page_info']['disclaimer']}*"
-        
-        dispatcher.utter_message(text=message)
+        dispatcher.utter_message(text=derived_view(data, render_advising_slip))
         return []
 
 
-class ActionAdmissionDeadlineCSE(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_cse"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'CSE' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Application Deadline:** {prog['application_deadline']}\n📝 **Test Date:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineBBA(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_bba"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'BBA' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Application Deadline:** {prog['application_deadline']}\n📝 **Test Date:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineEconomics(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_economics"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'Economics' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineEnglish(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_english"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'English' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineLaw(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_law"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'LLB' in p['program'] or 'Law' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineSociology(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_sociology"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'Sociology' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineInformationStudies(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_information_studies"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'Information Studies' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlinePPHS(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_pphs"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'Public Health' in p['program'] or 'PPHS' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineICE(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_ice"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'ICE' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineEEE(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_eee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'EEE' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlinePharmacy(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_pharmacy"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'Pharmacy' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineGEB(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_geb"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'Genetic' in p['program'] or 'Biotechnology' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineCivil(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_civil"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'Civil' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineMath(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_math"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'Mathematics' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineDataScience(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_data_science"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'Data Science' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-# ========================================
-# ADMISSION DEADLINES (GRADUATE)
-# ========================================
-
-class ActionAdmissionDeadlineMBA(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_mba"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'MBA' in p['program'] and 'Executive' not in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineEMBA(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_emba"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'Executive MBA' in p['program'] or 'EMBA' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineMDS(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_mds"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'MDS' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineMSSEconomics(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_mss_economics"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'MSS' in p['program'] and 'Economics' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineMAEnglish(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_ma_english"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'MA in English' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineMATESOL(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_ma_tesol"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'TESOL' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineMPRHGD(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_mprhgd"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'MPRHGD' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineLLM(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_llm"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'LLM' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineMSCSE(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_ms_cse"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'MS in CSE' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineMSDataScience(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_ms_data_science"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'Data Science' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlineMPharm(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_mpharm"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'Master of Pharmacy' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionDeadlinePPDM(Action):
-    def name(self) -> Text:
-        return "action_admission_deadline_ppdm"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'PPDM' in p['program']), None)
-        if prog:
-            message = f"**{prog['program']}**\n\n📅 **Deadline:** {prog['application_deadline']}\n📝 **Test:** {prog['admission_test']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-# ========================================
-# ADMISSION TEST DATES
-# ========================================
-
-class ActionAdmissionTestDateGeneral(Action):
-    def name(self) -> Text:
-        return "action_admission_test_date_general"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        message = "**Admission Test Dates at EWU**\n\n"
-        message += "**Engineering/Science Programs:** Aug 30, 2025 at 2:30 PM\n"
-        message += "**Business/Arts Programs:** Aug 30, 2025 at 10:00 AM\n\n"
-        message += "*For specific program test dates, please ask about your desired program.*"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionAdmissionTestDateCSE(Action):
-    def name(self) -> Text:
-        return "action_admission_test_date_cse"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'CSE' in p['program']), None)
-        if prog:
-            message = f"**Computer Science & Engineering (CSE) Admission Test**\n\n"
-            message += f" **Test:** {prog['admission_test']}\n"
-            message += f" **Apply by:** {prog['application_deadline']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionTestDateBBA(Action):
-    def name(self) -> Text:
-        return "action_admission_test_date_bba"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['undergraduate_admission'] if 'BBA' in p['program']), None)
-        if prog:
-            message = f"**BBA Admission Test**\n\n"
-            message += f" **Test:** {prog['admission_test']}\n"
-            message += f" **Apply by:** {prog['application_deadline']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionAdmissionTestDateMBA(Action):
-    def name(self) -> Text:
-        return "action_admission_test_date_mba"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_calendar()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prog = next((p for p in data['graduate_admission'] if 'MBA' in p['program'] and 'Executive' not in p['program']), None)
-        if prog:
-            message = f"**MBA Admission Test**\n\n"
-            message += f" **Test:** {prog['admission_test']}\n"
-            message += f" **Apply by:** {prog['application_deadline']}"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-# ========================================
-# ADMISSION REQUIREMENTS ACTIONS
-# ========================================
-
-class ActionAdmissionRequirementsGeneral(Action):
-    def name(self) -> Text:
-        return "action_admission_requirements_general"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_requirements()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        ug = data['admission_requirements']['undergraduate']['general_programs_except_bpharm']
-        message = "**Undergraduate Admission Requirements at EWU**\n\n"
-        message += f" **SSC & HSC:** {ug['ssc_hsc']}\n"
-        message += f" **Diploma:** {ug['diploma']}\n"
-        message += f" **O/A Levels:** {ug['o_a_levels']['requirement']}\n\n"
-        message += "**Admission Test Weightage:**\n"
-        message += f"- Admission Test: {ug['admission_test']['weightage']['admission_test']}\n"
-        message += f"- SSC/O Level: {ug['admission_test']['weightage']['ssc_o_level']}\n"
-        message += f"- HSC/A Level: {ug['admission_test']['weightage']['hsc_a_level']}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionAdmissionRequirementsCSE(Action):
-    def name(self) -> Text:
-        return "action_admission_requirements_cse"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_requirements()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        ug = data['admission_requirements']['undergraduate']['general_programs_except_bpharm']
-        cse_req = ug['subject_requirements']['cse']
-        message = "**B.Sc. in CSE Admission Requirements**\n\n"
-        message += f" **Academic:** {ug['ssc_hsc']}\n"
-        message += f" **Subject Requirements:** {cse_req}\n\n"
-        message += "**Test Weightage:**\n"
-        message += f"- Admission Test: {ug['admission_test']['weightage']['admission_test']}\n"
-        message += f"- SSC: {ug['admission_test']['weightage']['ssc_o_level']}\n"
-        message += f"- HSC: {ug['admission_test']['weightage']['hsc_a_level']}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionAdmissionRequirementsPharmacy(Action):
-    def name(self) -> Text:
-        return "action_admission_requirements_pharmacy"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_requirements()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        pharm = data['admission_requirements']['undergraduate']['bpharm']
-        message = "**B.Pharm Admission Requirements**\n\n"
-        message += f"🇧🇩 **Citizenship:** {pharm['citizenship']}\n"
-        message += f" **GPA:** {pharm['ssc_hsc']['aggregate']}\n"
-        message += f" **Each Exam:** {pharm['ssc_hsc']['minimum_each']}\n\n"
-        message += "**Subject Requirements (Minimum GPA):**\n"
-        message += f"- Chemistry: {pharm['subject_gpa']['chemistry']}\n"
-        message += f"- Biology: {pharm['subject_gpa']['biology']}\n"
-        message += f"- Physics: {pharm['subject_gpa']['physics']}\n"
-        message += f"- Mathematics: {pharm['subject_gpa']['mathematics']}\n\n"
-        message += f" {pharm['special_note']}\n"
-        message += f" {pharm['year_of_pass']}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionAdmissionRequirementsMBA(Action):
-    def name(self) -> Text:
-        return "action_admission_requirements_mba"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_requirements()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        mba = data['admission_requirements']['graduate']['mba_emba']
-        message = "**MBA Admission Requirements**\n\n"
-        message += f" **Degree:** {mba['degree']}\n"
-        message += f" *SSC & HSC:** {mba['ssc_hsc_gpa']}\n"
-        message += f"💼 **Work Experience:** {mba['mba']['work_experience']}\n\n"
-        message += "**Test Exemptions:**\n"
-        message += f"- EWU Graduates: {mba['test_exemptions']['ewu_graduates']}\n"
-        message += f"- Other Universities: {mba['test_exemptions']['other_universities']}"
-        dispatcher.utter_message(text=message)
-        return []
-
-# ============================================================================
-# MISSING ADMISSION PROCESS ACTION FUNCTIONS
-# ============================================================================
-
-class ActionAdmissionApplicationSteps(Action):
-    """Display all 11 application steps for admission"""
-    def name(self) -> Text:
-        return "action_admission_application_steps"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_process()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        app_section = data.get('admission_process', {}).get('application', {})
-        message = "** EWU Admission Application - 11 Steps**\n\n"
-        
-        # Website links
-        links = app_section.get('website_links', [])
-        message += "** Admission Websites:**\n"
-        for link in links:
-            message += f"- {link}\n"
-        
-        # Browser recommendations
-        browsers = app_section.get('browser_recommendation', [])
-        message += f"\n** Recommended Browsers:** {', '.join(browsers)}\n\n"
-        
-        # Application steps
-        steps = app_section.get('steps', [])
-        message += "** Application Steps:**\n\n"
-    
-        for step_info in steps:
-            step_num = step_info.get('step', '')
-            action = step_info.get('action', '')
-            details = step_info.get('details', '')
-            
-            message += f"**Step {step_num}: {action}**\n"
-            
-            if isinstance(details, dict):
-                for key, value in details.items():
-                    message += f"- **{key}:** "
-                    if isinstance(value, list):
-                        message += "\n"
-                        for item in value:
-                            message += f"  • {item}\n"
-                    else:
-                        message += f"{value}\n"
-            elif isinstance(details, list):
-                for detail in details:
-                    message += f"- {detail}\n"
-            else:
-                message += f"{details}\n"
-            message += "\n"
-        
-        dispatcher.utter_message(text=message)
-        return []
-
-
-class ActionAdmissionContact(Action):
-    """Display admission office contact information"""
-    def name(self) -> Text:
-        return "action_admission_contact"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_process()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        admission = data.get('admission_process', {})
-        contacts = admission.get('contacts', {})
-        
-        message = "** EWU Admission Contact Information**\n\n"
-                # Admission Office
-        admission_office = contacts.get('admission_office', {})
-        message += "** Admission Office**\n"
-        message+= f" Address: {admission_office.get('address', 'N/A')}\n\n"
-        message += "** Phone Numbers:**\n"
-        for phone in admission_office.get('phone', []):
-            message += f"- {phone}\n"
-        message += f"Email: {admission_office.get('email', 'N/A')}\n\n"
-        
-        # Support Contacts
-        support = contacts.get('support', {})
-        message += "** Support Contacts:**\n"
-        message += f" Payment Issues: {support.get('payment_issues', 'N/A')}\n"
-        message += f" Technical Issues: {support.get('technical_issues', 'N/A')}\n"
-        message += f" Advising/Courses: {support.get('advising_or_course_issues', 'N/A')}\n\n"
-        
-        # Registrar
-        registrar = admission.get('registrar', {})
-        message += "** Registrar**\n"
-        message += f"- {registrar.get('name', 'N/A')}\n"
-        message += f"- {registrar.get('designation', 'N/A')}\n"
-        message += f"- {registrar.get('university', 'N/A')}"
-        
-        dispatcher.utter_message(text=message)
-        return []
-
-
-class ActionPostAdmissionGSuite(Action):
-    """Display G Suite email activation instructions"""
-    def name(self) -> Text:
-        return "action_post_admission_g_suite"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_process()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        g_suite = data.get('admission_process', {}).get('post_admission', {}).get('g_suite_activation', {})
-        
-        message = "** EWU G Suite Email Activation**\n\n"
-        message += f"** Important Note:** {g_suite.get('note', 'N/A')}\n\n"
-        message += f"** Portal Link:** {g_suite.get('link', 'N/A')}\n\n"
-        message += "**Step-by-Step Instructions:**\n"
-        
-        for i, instruction in enumerate(g_suite.get('instructions', []), 1):
-            message += f"{i}. {instruction}\n"
-        
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionPostAdmissionDocumentUpload(Action):
-    """Display document upload requirements"""
-    def name(self) -> Text:
-        return "action_post_admission_document_upload"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        
-        data = load_admission_requirements()
-        
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        required_docs = data.get('admission_requirements', {}).get('required_documents', [])
-        
-        if not required_docs:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        message = "** Required Documents for Admission**\n\n"
-        message += f"**University:** {data.get('university', 'East West University')}\n\n"
-        
-        message += "** Documents You Need to Bring:**\n\n"
-        for i, doc in enumerate(required_docs, 1):
-            message += f"{i}. {doc}\n"
-        
-        message += "\n** Important Note:**\n"
-        message += "• Bring both original documents and photocopies\n"
-        message += "• Original documents will be returned after verification\n"
-        message += "• Make sure all documents are complete and properly attested\n"
-        
-        dispatcher.utter_message(text=message)
-        return []
-
-
-
-
-class ActionPostAdmissionAdvisingSlip(Action):
-    """Display advising slip access information"""
-    def name(self) -> Text:
-        return "action_post_admission_advising_slip"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_process()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        advising = data.get('admission_process', {}).get('post_admission', {}).get('advising_slip', {})
-        
-        message = "** Advising Slip Access**\n\n"
-        message += f"**Purpose:** {advising.get('purpose', 'N/A')}\n\n"
-        
-        message += "**How to Access (4 Steps):**\n"
-        for i, instruction in enumerate(advising.get('instructions', []), 1):
-            message += f"{i}. {instruction}\n"
-        
-        message += f"\n**Academic Calendar:** {advising.get('academic_calendar_link', 'N/A')}"
-        
-        dispatcher.utter_message(text=message)
-        return []
-
-
-class ActionPostAdmissionTuitionPayment(Action):
-    """Display tuition payment information"""
-    def name(self) -> Text:
-        return "action_post_admission_tuition_payment"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_process()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        tuition = data.get('admission_process', {}).get('post_admission', {}).get('tuition_payment', {})
-        
-        message = "** Tuition Payment Information**\n\n"
-        
-        message += "**Requirements:**\n"
-        for req in tuition.get('requirements', []):
-            message += f"✓ {req}\n"
-        
-        message += "**\n**Payment Methods:**\n"
-        for method in tuition.get('payment_methods', []):
-            message += f"- {method}\n"
-        
-        message += f"\n** Important Note:**\n{tuition.get('important_note', 'N/A')}"
-        
-        dispatcher.utter_message(text=message)
-        return []
-
-
-class ActionAdmissionImportantNotes(Action):
-    """Display important admission notes"""
-    def name(self) -> Text:
-        return "action_admission_important_notes"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_process()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        notes = data.get('admission_process', {}).get('important_notes', [])
-        
-        message = "** Important Admission Notes**\n\n"
-        for i, note in enumerate(notes, 1):
-            message += f"{i}. {note}\n\n"
-        
-        dispatcher.utter_message(text=message)
-        return []
-
-
-class ActionCompleteAdmissionProcess(Action):
-    """Display complete admission process overview"""
-    def name(self) -> Text:
-        return "action_complete_admission_process"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_admission_process()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        message = "** Complete EWU Admission Process**\n\n"
-        
-        message += "**PHASE 1: APPLICATION (11 Steps)**\n"
-        message += "- Visit EWU admission website\n"
-        message += "- Create account and select program\n"
-        message += "- Fill application form\n"
-        message += "- Pay application fee (Tk 1500)\n"
-        message += "- Upload photo & signature\n"
-        message += "- Submit form\n"
-        message += "- Download admit card\n"
-        message += "- Bring documents to exam\n\n"
-        
-        message += "**PHASE 2: POST-ADMISSION SETUP**\n"
-        message += " Activate G Suite email account\n"
-        message += " Upload required academic documents (8 docs)\n"
-        message += " View advising slip with courses\n"
-        message += " Pay tuition via designated banks\n\n"
-        
-        message += "**Need More Information?**\n"
-        message += "Ask about: application steps, documents, email setup, payment methods, or contact info."
-        
-        dispatcher.utter_message(text=message)
-        return []
-
-
-class ActionAdmissionHelp(Action):
-    """Help with admission queries"""
-    def name(self) -> Text:
-        return "action_admission_help"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        message = "** Admission Help**\n\n"
-        message += "I can help you with:\n"
-        message += "-  Application steps (11 steps detailed)\n"
-        message += "-  Contact information\n"
-        message += "-  Email setup after admission\n"
-        message += "-  Document requirements\n"
-        message += "-  Tuition payment methods\n"
-        message += "-  Advising slip information\n"
-        message += "-  Important policies\n\n"
-        message += "What would you like to know?"
-        
-        dispatcher.utter_message(text=message)
-        return []
-
-
-# ========================================
-# FACILITIES ACTIONS
-# ========================================
-
-class ActionFacilitiesGeneral(Action):
-    def name(self) -> Text:
-        return "action_facilities_general"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        campus = data['facilities']['campus_life']['available']
-        message = "**East West University Campus Facilities**\n\n"
-        for facility in campus[:7]:
-            message += f" **{facility['name']}**\n{facility['description']}\n\n"
-        message += "*Ask about specific facilities like library, labs, cafeteria, wifi, etc.*"
-        dispatcher.utter_message(text=message)
-        return []
-
-
-class ActionLabFacilities(Action):
-    def name(self) -> Text:
-        return "action_lab_facilities"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        eng_labs = data['facilities']['engineering_labs']
-        message = "**Engineering Laboratories at EWU**\n\n"
-        message += f"**Departments:** {', '.join(eng_labs['departments'])}\n\n"
-        message += "**Available Labs:**\n"
-        for lab in eng_labs['labs'][:5]:
-            message += f" {lab['name']}\n"
-        message += f"\n*Total: {len(eng_labs['labs'])} specialized labs available*"
-        dispatcher.utter_message(text=message)
-        return []
-    
-# ========================================
-# MISSING FACILITY ACTIONS
-# ========================================
-
-class ActionCampusLife(Action):
-    def name(self) -> Text:
-        return "action_campus_life"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        campus_life = data.get('facilities', {}).get('campus_life', {})
-        message = f"**Campus Life**\n\n{campus_life.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionCivilEngineeringLabs(Action):
-    def name(self) -> Text:
-        return "action_civil_engineering_labs"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        labs = data.get('facilities', {}).get('civil_engineering_labs', {})
-        message = f"**Civil Engineering Labs**\n\n{labs.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionEngineeringLabs(Action):
-    def name(self) -> Text:
-        return "action_engineering_labs"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        labs = data.get('facilities', {}).get('engineering_labs', {})
-        message = f"**Engineering Labs**\n\n{labs.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionICSServices(Action):
-    def name(self) -> Text:
-        return "action_ics_services"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        ics = data.get('facilities', {}).get('ics_services', {})
-        message = f"**ICS Services**\n\n{ics.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionPharmacyLabs(Action):
-    def name(self) -> Text:
-        return "action_pharmacy_labs"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        labs = data.get('facilities', {}).get('pharmacy_labs', {})
-        message = f"**Pharmacy Labs**\n\n{labs.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionResearchCenter(Action):
-    def name(self) -> Text:
-        return "action_research_center"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        center = data.get('facilities', {}).get('research_center', {})
-        message = f"**Research Center**\n\n{center.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionComputerLab(Action):
-    def name(self) -> Text:
-        return "action_computer_lab"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        lab = data.get('facilities', {}).get('computer_lab', {})
-        message = f"**Computer Lab**\n\n{lab.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionWiFiInternet(Action):
-    def name(self) -> Text:
-        return "action_wifi_internet"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        wifi = data.get('facilities', {}).get('wifi_internet', {})
-        message = f"**WiFi & Internet**\n\n{wifi.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionParkingFacilities(Action):
-    def name(self) -> Text:
-        return "action_parking_facilities"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        parking = data.get('facilities', {}).get('parking_facilities', {})
-        message = f"**Parking Facilities**\n\n{parking.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionSportsFacilities(Action):
-    def name(self) -> Text:
-        return "action_sports_facilities"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        sports = data.get('facilities', {}).get('sports_facilities', {})
-        message = f"**Sports Facilities**\n\n{sports.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionHostelFacilities(Action):
-    def name(self) -> Text:
-        return "action_hostel_facilities"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        hostel = data.get('facilities', {}).get('hostel_facilities', {})
-        message = f"**Hostel Facilities**\n\n{hostel.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionMedicalFacilities(Action):
-    def name(self) -> Text:
-        return "action_medical_facilities"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        medical = data.get('facilities', {}).get('medical_facilities', {})
-        message = f"**Medical Facilities**\n\n{medical.get('description', 'Yes, medical facilities are available https://www.ewubd.edu/admin-office/ewu-medical-centre')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionPrayerRoom(Action):
-    def name(self) -> Text:
-        return "action_prayer_room"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        prayer = data.get('facilities', {}).get('prayer_room', {})
-        message = f"**Prayer Room**\n\n{prayer.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionCommonRoom(Action):
-    def name(self) -> Text:
-        return "action_common_room"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        common = data.get('facilities', {}).get('common_room', {})
-        message = f"**Common Room**\n\n{common.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionCareerCounseling(Action):
-    def name(self) -> Text:
-        return "action_career_counseling"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        career = data.get('facilities', {}).get('career_counseling', {})
-        message = f"**Career Counseling**\n\n{career.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-# ========================================
-# MISSING FACILITY ACTIONS (4 remaining)
-# ========================================
-
-class ActionCafeteriaFacilities(Action):
-    def name(self) -> Text:
-        return "action_cafeteria_facilities"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        cafeteria = data.get('facilities', {}).get('cafeteria', {})
-        message = f"**Cafeteria Facilities**\n\n{cafeteria.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionLibraryFacilities(Action):
-    def name(self) -> Text:
-        return "action_library_facilities"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        library = data.get('facilities', {}).get('library', {})
-        message = f"**Library Facilities**\n\n{library.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionTransportationFacilities(Action):
-    def name(self) -> Text:
-        return "action_transportation_facilities"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_facilities()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        transport = data.get('facilities', {}).get('transportation', {})
-        message = f"**Transportation Facilities**\n\n{transport.get('description', 'N/A')}"
-        dispatcher.utter_message(text=message)
-        return []
-
-
-# ========================================
-# EVENTS ACTIONS
-# ========================================
-
-
-# ========================================
-# FACULTY ACTIONS
-# ========================================
-
-class ActionFacultyInfo(Action):
-    def name(self) -> Text:
-        return "action_faculty_info"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        message = "**Faculty Information - East West University**\n\n"
-        message += f"**Total Departments:** {len(data.get('departments', []))}\n\n"
-        message += "**Available Departments:**\n"
-        for dept in list(data.get('departments', []))[:8]:
-            name = dept.get('department_name', 'Unknown')
-            message += f" {name}\n"
-        message += "\n*As about specific department faculty (e.g., CSE faculty, BBA faculty)*"
-        dispatcher.utter_message(text=message)
-        return []
-
-class ActionFacultyCSE(Action):
-    def name(self) -> Text:
-        return "action_faculty_cse"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        cse_dept = next((d for d in data.get('departments', [])
-                        if 'CSE' in d.get('department_name', '') or 'Computer Science' in d.get('department_name', '')), None)
-        if cse_dept and 'faculty_members' in cse_dept:
-            message = f"**{cse_dept['department_name']} Faculty**\n\n"
-            for faculty in cse_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(cse_dept['faculty_members'])
-            message += f"*Total CSE Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionFacultyBBA(Action):
-    def name(self) -> Text:
-        return "action_faculty_bba"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        bba_dept = next((d for d in data.get('departments', [])
-                        if 'BBA' in d.get('department_name', '') or 'Business' in d.get('department_name', '')), None)
-        if bba_dept and 'faculty_members' in bba_dept:
-            message = f"**{bba_dept['department_name']} Faculty**\n\n"
-            for faculty in bba_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(bba_dept['faculty_members'])
-            message += f"*Total BBA Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-    
-class ActionFacultyEEE(Action):
-    def name(self) -> Text:
-        return "action_faculty_eee"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        eee_dept = next((d for d in data.get('departments', [])
-                        if 'EEE' in d.get('department_name', '') or 'Electrical' in d.get('department_name', '')), None)
-        if eee_dept and 'faculty_members' in eee_dept:
-            message = f"**{eee_dept['department_name']} Faculty**\n\n"
-            for faculty in eee_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(eee_dept['faculty_members'])
-            message += f"*Total EEE Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionFacultyICE(Action):
-    def name(self) -> Text:
-        return "action_faculty_ice"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        ice_dept = next((d for d in data.get('departments', [])
-                        if 'ICE' in d.get('department_name', '') or 'Communication' in d.get('department_name', '')), None)
-        if ice_dept and 'faculty_members' in ice_dept:
-            message = f"**{ice_dept['department_name']} Faculty**\n\n"
-            for faculty in ice_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(ice_dept['faculty_members'])
-            message += f"*Total ICE Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionFacultyPharmacy(Action):
-    def name(self) -> Text:
-        return "action_faculty_pharmacy"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        pharm_dept = next((d for d in data.get('departments', [])
-                          if 'Pharmacy' in d.get('department_name', '')), None)
-        if pharm_dept and 'faculty_members' in pharm_dept:
-            message = f"**{pharm_dept['department_name']} Faculty**\n\n"
-            for faculty in pharm_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(pharm_dept['faculty_members'])
-            message += f"*Total Pharmacy Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
-
-class ActionFacultyCivil(Action):
-    def name(self) -> Text:
-        return "action_faculty_civil"
-    
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        civil_dept = next((d for d in data.get('departments', [])
-                          if 'Civil' in d.get('department_name', '')), None)
-        if civil_dept and 'faculty_members' in civil_dept:
-            message = f"**{civil_dept['department_name']} Faculty**\n\n"
-            for faculty in civil_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(civil_dept['faculty_members'])
-            message += f"*Total Civil Engineering Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+def render_tuition_payment(data):
+    tuition = data.get('admission_process', {}).get('post_admission', {}).get('tuition_payment', {})
+    
+    parts = ["** Tuition Payment Information**\n\n", "**Requirements:**\n"]
+    parts.extend(f"✓ {req}\n" for req in tuition.get('requirements', []))
+    parts.append("**\n**Payment Methods:**\n")
+    parts.extend(f"- {method}\n" for method in tuition.get('payment_methods', []))
+    parts.append(f"\n** Important Note:**\n{tuition.get('important_note', 'N/A')}")
+    return "".join(parts)
 
-class ActionFacultyGEB(Action):
+class ActionPostAdmissionTuitionPayment(Action):
+    """Display tuition payment information"""
     def name(self) -> Text:
-        return "action_faculty_geb"
+        return "action_post_admission_tuition_payment"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
+        data = load_admission_process()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
         
-        geb_dept = next((d for d in data.get('departments', [])
-                        if 'GEB' in d.get('department_name', '') or 'Genetic Engineering' in d.get('department_name', '')), None)
-        if geb_dept and 'faculty_members' in geb_dept:
-            message = f"**{geb_dept['department_name']} Faculty**\n\n"
-            for faculty in geb_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(geb_dept['faculty_members'])
-            message += f"*Total GEB Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        dispatcher.utter_message(text=derived_view(data, render_tuition_payment))
+        return []
+
+
+def render_important_notes(data):
+    notes = data.get('admission_process', {}).get('important_notes', [])
+    
+    return "** Important Admission Notes**\n\n" + "".join(
+        f"{i}. {note}\n\n" for i, note in enumerate(notes, 1))
 
-class ActionFacultyEconomics(Action):
+class ActionAdmissionImportantNotes(Action):
+    """Display important admission notes"""
     def name(self) -> Text:
-        return "action_faculty_economics"
+        return "action_admission_important_notes"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
+        data = load_admission_process()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
         
-        econ_dept = next((d for d in data.get('departments', [])
-                         if 'Economics' in d.get('department_name', '')), None)
-        if econ_dept and 'faculty_members' in econ_dept:
-            message = f"**{econ_dept['department_name']} Faculty**\n\n"
-            for faculty in econ_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(econ_dept['faculty_members'])
-            message += f"*Total Economics Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        dispatcher.utter_message(text=derived_view(data, render_important_notes))
+        return []
+
+
+ADMISSION_PROCESS_OVERVIEW = ("** Complete EWU Admission Process**\n\n"
+                              "**PHASE 1: APPLICATION (11 Steps)**\n"
+                              "- Visit EWU admission website\n"
+                              "- Create account and select program\n"
+                              "- Fill application form\n"
+                              "- Pay application fee (Tk 1500)\n"
+                              "- Upload photo & signature\n"
+                              "- Submit form\n"
+                              "- Download admit card\n"
+                              "- Bring documents to exam\n\n"
+                              "**PHASE 2: POST-ADMISSION SETUP**\n"
+                              " Activate G Suite email account\n"
+                              " Upload required academic documents (8 docs)\n"
+                              " View advising slip with courses\n"
+                              " Pay tuition via designated banks\n\n"
+                              "**Need More Information?**\n"
+                              "Ask about: application steps, documents, email setup, payment methods, or contact info.")
 
-class ActionFacultyEnglish(Action):
+class ActionCompleteAdmissionProcess(Action):
+    """Display complete admission process overview"""
     def name(self) -> Text:
-        return "action_faculty_english"
+        return "action_complete_admission_process"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
+        data = load_admission_process()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
         
-        eng_dept = next((d for d in data.get('departments', [])
-                        if 'English' in d.get('department_name', '')), None)
-        if eng_dept and 'faculty_members' in eng_dept:
-            message = f"**{eng_dept['department_name']} Faculty**\n\n"
-            for faculty in eng_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(eng_dept['faculty_members'])
-            message += f"*Total English Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        dispatcher.utter_message(text=ADMISSION_PROCESS_OVERVIEW)
+        return []
+
 
-class ActionFacultyLaw(Action):
+ADMISSION_HELP = ("** Admission Help**\n\n"
+                  "I can help you with:\n"
+                  "-  Application steps (11 steps detailed)\n"
+                  "-  Contact information\n"
+                  "-  Email setup after admission\n"
+                  "-  Document requirements\n"
+                  "-  Tuition payment methods\n"
+                  "-  Advising slip information\n"
+                  "-  Important policies\n\n"
+                  "What would you like to know?")
+
+class ActionAdmissionHelp(Action):
+    """Help with admission queries"""
     def name(self) -> Text:
-        return "action_faculty_law"
+        return "action_admission_help"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        law_dept = next((d for d in data.get('departments', [])
-                        if 'Law' in d.get('department_name', '')), None)
-        if law_dept and 'faculty_members' in law_dept:
-            message = f"**{law_dept['department_name']} Faculty**\n\n"
-            for faculty in law_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(law_dept['faculty_members'])
-            message += f"*Total Law Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        dispatcher.utter_message(text=ADMISSION_HELP)
+        return []
+
+
+# ========================================
+# FACILITIES ACTIONS
+# ========================================
+
+def render_campus_facilities(data):
+    campus = data['facilities']['campus_life']['available']
+    parts = ["**East West University Campus Facilities**\n\n"]
+    parts.extend(f" **{facility['name']}**\n{facility['description']}\n\n" for facility in campus[:7])
+    parts.append("*Ask about specific facilities like library, labs, cafeteria, wifi, etc.*")
+    return "".join(parts)
 
-class ActionFacultyMath(Action):
+class ActionFacilitiesGeneral(Action):
     def name(self) -> Text:
-        return "action_faculty_math"
+        return "action_facilities_general"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
+        data = load_facilities()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
         
-        math_dept = next((d for d in data.get('departments', [])
-                         if 'Mathematics' in d.get('department_name', '')), None)
-        if math_dept and 'faculty_members' in math_dept:
-            message = f"**{math_dept['department_name']} Faculty**\n\n"
-            for faculty in math_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(math_dept['faculty_members'])
-            message += f"*Total Mathematics Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        dispatcher.utter_message(text=derived_view(data, render_campus_facilities))
+        return []
 
-class ActionFacultySociology(Action):
+
+def render_engineering_labs(data):
+    eng_labs = data['facilities']['engineering_labs']
+    parts = [
+        "**Engineering Laboratories at EWU**\n\n",
+        f"**Departments:** {', '.join(eng_labs['departments'])}\n\n",
+        "**Available Labs:**\n",
+    ]
+    parts.extend(f" {lab['name']}\n" for lab in eng_labs['labs'][:5])
+    parts.append(f"\n*Total: {len(eng_labs['labs'])} specialized labs available*")
+    return "".join(parts)
+
+class ActionLabFacilities(Action):
     def name(self) -> Text:
-        return "action_faculty_sociology"
+        return "action_lab_facilities"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
+        data = load_facilities()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
         
-        soc_dept = next((d for d in data.get('departments', [])
-                        if 'Sociology' in d.get('department_name', '')), None)
-        if soc_dept and 'faculty_members' in soc_dept:
-            message = f"**{soc_dept['department_name']} Faculty**\n\n"
-            for faculty in soc_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(soc_dept['faculty_members'])
-            message += f"*Total Sociology Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        dispatcher.utter_message(text=derived_view(data, render_engineering_labs))
+        return []
+    
+# ========================================
+# FACILITY DESCRIPTION ACTIONS
+# ========================================
+
+# (class name, action name, key under data['facilities'], title, reply when the description is missing)
+FACILITY_ACTIONS = [
+    ("ActionCampusLife", "action_campus_life", "campus_life", "Campus Life", "N/A"),
+    ("ActionCivilEngineeringLabs", "action_civil_engineering_labs", "civil_engineering_labs", "Civil Engineering Labs", "N/A"),
+    ("ActionEngineeringLabs", "action_engineering_labs", "engineering_labs", "Engineering Labs", "N/A"),
+    ("ActionICSServices", "action_ics_services", "ics_services", "ICS Services", "N/A"),
+    ("ActionPharmacyLabs", "action_pharmacy_labs", "pharmacy_labs", "Pharmacy Labs", "N/A"),
+    ("ActionResearchCenter", "action_research_center", "research_center", "Research Center", "N/A"),
+    ("ActionComputerLab", "action_computer_lab", "computer_lab", "Computer Lab", "N/A"),
+    ("ActionWiFiInternet", "action_wifi_internet", "wifi_internet", "WiFi & Internet", "N/A"),
+    ("ActionParkingFacilities", "action_parking_facilities", "parking_facilities", "Parking Facilities", "N/A"),
+    ("ActionSportsFacilities", "action_sports_facilities", "sports_facilities", "Sports Facilities", "N/A"),
+    ("ActionHostelFacilities", "action_hostel_facilities", "hostel_facilities", "Hostel Facilities", "N/A"),
+    ("ActionMedicalFacilities", "action_medical_facilities", "medical_facilities", "Medical Facilities",
+     "Yes, medical facilities are available https://www.ewubd.edu/admin-office/ewu-medical-centre"),
+    ("ActionPrayerRoom", "action_prayer_room", "prayer_room", "Prayer Room", "N/A"),
+    ("ActionCommonRoom", "action_common_room", "common_room", "Common Room", "N/A"),
+    ("ActionCareerCounseling", "action_career_counseling", "career_counseling", "Career Counseling", "N/A"),
+    ("ActionCafeteriaFacilities", "action_cafeteria_facilities", "cafeteria", "Cafeteria Facilities", "N/A"),
+    ("ActionLibraryFacilities", "action_library_facilities", "library", "Library Facilities", "N/A"),
+    ("ActionTransportationFacilities", "action_transportation_facilities", "transportation", "Transportation Facilities", "N/A"),
+]
+
+def build_facility_messages(data):
+    """Render every facility description reply once per loaded document"""
+    facilities = data.get('facilities', {})
+    messages = {}
+    for _, _, key, title, default in FACILITY_ACTIONS:
+        section = facilities.get(key, {})
+        messages[key] = f"**{title}**\n\n{section.get('description', default)}"
+    return messages
+
+def load_facility_messages():
+    data = load_facilities()
+    if not data:
+        return None
+    return derived_view(data, build_facility_messages)
 
-class ActionFacultyInformationStudies(Action):
+def make_facility_action(class_name, action_name, key):
+    """Build the Action subclass that sends one facility's pre-rendered description"""
     def name(self) -> Text:
-        return "action_faculty_information_studies"
-    
+        return action_name
+
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
-        if not data:
+        messages = load_facility_messages()
+        if not messages:
             return call_rag_fallback(dispatcher, tracker, domain)
-        
-        is_dept = next((d for d in data.get('departments', [])
-                       if 'Information Studies' in d.get('department_name', '')), None)
-        if is_dept and 'faculty_members' in is_dept:
-            message = f"**{is_dept['department_name']} Faculty**\n\n"
-            for faculty in is_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(is_dept['faculty_members'])
-            message += f"*Total Information Studies Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        dispatcher.utter_message(text=messages[key])
+        return []
 
-class ActionFacultyPPHS(Action):
+    return type(class_name, (Action,), {"name": name, "run": run, "__module__": __name__})
+
+for _class_name, _action_name, _key, _, _ in FACILITY_ACTIONS:
+    globals()[_class_name] = make_facility_action(_class_name, _action_name, _key)
+
+# Facility intents from rules.yml -> key under data['facilities']; hostel_facilities is not here because
+# its rule answers with the curated utter_hostel response (EWU has no on-campus hostel)
+FACILITY_INTENT_KEYS = {
+    "library_facilities": "library",
+    "computer_lab": "computer_lab",
+    "engineering_lab": "engineering_labs",
+    "cafeteria_facilities": "cafeteria",
+    "wifi_internet": "wifi_internet",
+    "parking_facilities": "parking_facilities",
+    "sports_facilities": "sports_facilities",
+    "transportation_facilities": "transportation",
+    "medical_facilities": "medical_facilities",
+    "prayer_room": "prayer_room",
+    "common_room": "common_room",
+    "career_counseling": "career_counseling",
+    "ics_services": "ics_services",
+}
+
+class ActionFacilityInfo(Action):
+    """Answers every single-facility intent with one action"""
     def name(self) -> Text:
-        return "action_faculty_pphs"
-    
+        return "action_facility_info"
+
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        data = load_faculty()
-        if not data:
-            return call_rag_fallback(dispatcher, tracker, domain)
-        
-        pphs_dept = next((d for d in data.get('departments', [])
-                         if 'PPHS' in d.get('department_name', '') or 'Public Health' in d.get('department_name', '')), None)
-        if pphs_dept and 'faculty_members' in pphs_dept:
-            message = f"**{pphs_dept['department_name']} Faculty**\n\n"
-            for faculty in pphs_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(pphs_dept['faculty_members'])
-            message += f"*Total PPHS Faculty: {total} members*"
+        key = FACILITY_INTENT_KEYS.get(tracker.latest_message.get("intent", {}).get("name"))
+        messages = load_facility_messages()
+        message = messages.get(key) if messages else None
+        if message:
             dispatcher.utter_message(text=message)
             return []
         return call_rag_fallback(dispatcher, tracker, domain)
 
-class ActionFacultyDataScience(Action):
+# ========================================
+# EVENTS ACTIONS
+# ========================================
+
+
+# ========================================
+# FACULTY ACTIONS
+# ========================================
+
+# (department key, label for the member count, substrings of department_name that identify it); first match wins
+FACULTY_DEPARTMENT_RULES = [
+    ("cse", "CSE", ("CSE", "Computer Science")),
+    ("bba", "BBA", ("BBA", "Business")),
+    ("eee", "EEE", ("EEE", "Electrical")),
+    ("ice", "ICE", ("ICE", "Communication")),
+    ("pharmacy", "Pharmacy", ("Pharmacy",)),
+    ("civil", "Civil Engineering", ("Civil",)),
+    ("geb", "GEB", ("GEB", "Genetic Engineering")),
+    ("economics", "Economics", ("Economics",)),
+    ("english", "English", ("English",)),
+    ("law", "Law", ("Law",)),
+    ("math", "Mathematics", ("Mathematics",)),
+    ("sociology", "Sociology", ("Sociology",)),
+    ("information_studies", "Information Studies", ("Information Studies",)),
+    ("pphs", "PPHS", ("PPHS", "Public Health")),
+    ("data_science", "Data Science", ("Data Science", "Analytics")),
+    ("social_relations", "Social Relations", ("Social Relations",)),
+]
+
+def build_faculty_index(data):
+    """Map each department key to its department once per loaded document"""
+    index = {}
+    for dept in data.get('departments', []):
+        name = dept.get('department_name', '')
+        for key, _, aliases in FACULTY_DEPARTMENT_RULES:
+            if key not in index and any(alias in name for alias in aliases):
+                index[key] = dept
+    return index
+
+def render_faculty_members(dept, label):
+    members = dept['faculty_members']
+    parts = [f"**{dept['department_name']} Faculty**\n\n"]
+    for faculty in members[:5]:
+        parts.append(f" **{faculty.get('name', 'N/A')}**\n   {faculty.get('designation', 'N/A')}\n")
+        if 'email' in faculty:
+            parts.append(f"  {faculty['email']}\n")
+        parts.append("\n")
+    parts.append(f"*Total {label} Faculty: {len(members)} members*")
+    return "".join(parts)
+
+def build_faculty_messages(data):
+    """Render the member list reply for every indexed department once per loaded document"""
+    index = derived_view(data, build_faculty_index)
+    messages = {}
+    for key, label, _ in FACULTY_DEPARTMENT_RULES:
+        dept = index.get(key)
+        if dept and 'faculty_members' in dept:
+            messages[key] = render_faculty_members(dept, label)
+    return messages
+
+def render_chairpersons(data):
+    # Chairpersons are the faculty with "Chairperson" in their designation
+    chairpersons = [f for f in data.get('faculty', []) if 'Chairperson' in f.get('designation', '')]
+    if not chairpersons:
+        return None
+    parts = ["**Department Chairpersons at EWU**\n\n"]
+    for chair in chairpersons:
+        parts.append(f" **{chair.get('name', 'N/A')}**\n"
+                     f"   Department: {chair.get('department', 'N/A')}\n"
+                     f"   Position: {chair.get('designation', 'N/A')}\n")
+        if 'profile_url' in chair:
+            parts.append(f"  Profile: {chair['profile_url']}\n")
+        parts.append("\n")
+    return "".join(parts)
+
+class ActionFacultyInfo(Action):
     def name(self) -> Text:
-        return "action_faculty_data_science"
+        return "action_faculty_info"
     
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
@@ -2732,47 +1696,56 @@ class ActionFacultyDataScience(Action):
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
         
-        ds_dept = next((d for d in data.get('departments', [])
-                       if 'Data Science' in d.get('department_name', '') or 'Analytics' in d.get('department_name', '')), None)
-        if ds_dept and 'faculty_members' in ds_dept:
-            message = f"**{ds_dept['department_name']} Faculty**\n\n"
-            for faculty in ds_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(ds_dept['faculty_members'])
-            message += f"*Total Data Science Faculty: {total} members*"
-            dispatcher.utter_message(text=message)
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        message = "**Faculty Information - East West University**\n\n"
+        message += f"**Total Departments:** {len(data.get('departments', []))}\n\n"
+        message += "**Available Departments:**\n"
+        for dept in list(data.get('departments', []))[:8]:
+            name = dept.get('department_name', 'Unknown')
+            message += f" {name}\n"
+        message += "\n*As about specific department faculty (e.g., CSE faculty, BBA faculty)*"
+        dispatcher.utter_message(text=message)
+        return []
+
+FACULTY_ACTIONS = [
+    ("ActionFacultyCSE", "action_faculty_cse", "cse"),
+    ("ActionFacultyBBA", "action_faculty_bba", "bba"),
+    ("ActionFacultyEEE", "action_faculty_eee", "eee"),
+    ("ActionFacultyICE", "action_faculty_ice", "ice"),
+    ("ActionFacultyPharmacy", "action_faculty_pharmacy", "pharmacy"),
+    ("ActionFacultyCivil", "action_faculty_civil", "civil"),
+    ("ActionFacultyGEB", "action_faculty_geb", "geb"),
+    ("ActionFacultyEconomics", "action_faculty_economics", "economics"),
+    ("ActionFacultyEnglish", "action_faculty_english", "english"),
+    ("ActionFacultyLaw", "action_faculty_law", "law"),
+    ("ActionFacultyMath", "action_faculty_math", "math"),
+    ("ActionFacultySociology", "action_faculty_sociology", "sociology"),
+    ("ActionFacultyInformationStudies", "action_faculty_information_studies", "information_studies"),
+    ("ActionFacultyPPHS", "action_faculty_pphs", "pphs"),
+    ("ActionFacultyDataScience", "action_faculty_data_science", "data_science"),
+    ("ActionFacultySocialRelations", "action_faculty_social_relations", "social_relations"),
+]
 
-class ActionFacultySocialRelations(Action):
+def make_faculty_action(class_name, action_name, key):
+    """Build the Action subclass that sends the pre-rendered member list for one department"""
     def name(self) -> Text:
-        return "action_faculty_social_relations"
-    
+        return action_name
+
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         data = load_faculty()
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
-        
-        sr_dept = next((d for d in data.get('departments', [])
-                       if 'Social Relations' in d.get('department_name', '')), None)
-        if sr_dept and 'faculty_members' in sr_dept:
-            message = f"**{sr_dept['department_name']} Faculty**\n\n"
-            for faculty in sr_dept['faculty_members'][:5]:
-                message += f" **{faculty.get('name', 'N/A')}**\n"
-                message += f"   {faculty.get('designation', 'N/A')}\n"
-                if 'email' in faculty:
-                    message += f"  {faculty['email']}\n"
-                message += "\n"
-            total = len(sr_dept['faculty_members'])
-            message += f"*Total Social Relations Faculty: {total} members*"
+        message = derived_view(data, build_faculty_messages).get(key)
+        if message:
             dispatcher.utter_message(text=message)
             return []
         return call_rag_fallback(dispatcher, tracker, domain)
+
+    return type(class_name, (Action,), {"name": name, "run": run, "__module__": __name__})
+
+for _class_name, _action_name, _key in FACULTY_ACTIONS:
+    globals()[_class_name] = make_faculty_action(_class_name, _action_name, _key)
+
 # ========================================
 # CHAIRPERSON INFORMATION ACTION
 # ========================================
@@ -2787,31 +1760,25 @@ class ActionChairpersonInfo(Action):
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
         
-        # Find all chairpersons (those with "Chairperson" in designation)
-        chairpersons = [f for f in data.get('faculty', []) 
-                       if 'Chairperson' in f.get('designation', '')]
-        
-        if chairpersons:
-            message = "**Department Chairpersons at EWU**\n\n"
-            for chair in chairpersons:
-                message += f" **{chair.get('name', 'N/A')}**\n"
-                message += f"   Department: {chair.get('department', 'N/A')}\n"
-                message += f"   Position: {chair.get('designation', 'N/A')}\n"
-                if 'profile_url' in chair:
-                    message += f"  Profile: {chair['profile_url']}\n"
-                message += "\n"
-            dispatcher.utter_message(text=message)
-            return []
-        else:
-            dispatcher.utter_message(text="Chairperson information not available.")
-            return []
-        return call_rag_fallback(dispatcher, tracker, domain)
+        message = derived_view(data, render_chairpersons)
+        dispatcher.utter_message(text=message or "Chairperson information not available.")
+        return []
 
 
 # ========================================
 # GRADING SYSTEM ACTION
 # ========================================
 
+def render_grading_system(data):
+    grading = data['grading_system']
+    parts = [f"**{grading['title']}**\n\n{grading['description']}\n\n**Grade Scale:**\n"]
+    parts.extend(f"- **{grade['letter_grade']}**: {grade['numerical_score']} - {grade['grade_point']} GPA\n"
+                 for grade in grading['grade_scale'])
+    parts.append("\n**Special Grades:**\n")
+    parts.extend(f"- **{spec_grade['grade']}**: {spec_grade['description']}\n"
+                 for spec_grade in grading['special_grades'])
+    return "".join(parts)
+
 class ActionGradingSystem(Action):
     def name(self) -> Text:
         return "action_grading_system"
@@ -2822,18 +1789,7 @@ class ActionGradingSystem(Action):
         if not data:
             return call_rag_fallback(dispatcher, tracker, domain)
         
-        grading = data['grading_system']
-        message = f"**{grading['title']}**\n\n"
-        message += f"{grading['description']}\n\n"
-        message += "**Grade Scale:**\n"
-        for grade in grading['grade_scale']:
-            message += f"- **{grade['letter_grade']}**: {grade['numerical_score']} - {grade['grade_point']} GPA\n"
-        
-        message += "\n**Special Grades:**\n"
-        for spec_grade in grading['special_grades']:
-            message += f"- **{spec_grade['grade']}**: {spec_grade['description']}\n"
-        
-        dispatcher.utter_message(text=message)
+        dispatcher.utter_message(text=derived_view(data, render_grading_system))
         return []
 
 
@@ -2917,6 +1873,78 @@ DEPARTMENT_FILES = {
 }
 
 
+# Spelling variations of a department -> DEPARTMENT_FILES key
+DEPARTMENT_ALIASES = {
+    # CSE variations
+    "computer science and engineering": "cse",
+    "computer science & engineering": "cse",
+    "computer science": "cse",
+    "comp sci": "cse",
+    "cs": "cse",
+    "cse": "cse",
+
+    # EEE variations
+    "electrical and electronics engineering": "eee",
+    "electrical & electronics engineering": "eee",
+    "electrical and electronics": "eee",
+    "electrical engineering": "eee",
+    "electrical": "eee",
+    "eee": "eee",
+    "electrical and electronic engineering": "eee",
+    "electrical electronic engineering": "eee",
+
+    # ECE variations
+    "electronics and communication engineering": "ece",
+    "electronics & communication engineering": "ece",
+    "electronics and communication": "ece",
+    "electronics": "ece",
+    "ece": "ece",
+
+    # Civil variations
+    "civil engineering": "civil",
+    "civil": "civil",
+    "ce": "civil",
+
+    # BBA variations
+    "business administration": "bba",
+    "business": "bba",
+    "bba": "bba",
+    "ba": "bba",
+
+    # Economics
+    "economics": "economics",
+    "eco": "economics",
+
+    # English
+    "english": "english",
+    "eng": "english",
+
+    # Pharmacy
+    "pharmacy": "pharmacy",
+    "pharm": "pharmacy",
+
+    # Law
+    "law": "law",
+
+    # Math
+    "mathematics": "math",
+    "math": "math",
+
+    # Sociology
+    "sociology": "sociology",
+    "soc": "sociology",
+
+    # Graduate
+    "mba": "mba",
+    "emba": "emba",
+    "ms cse": "ms cse",
+    "msc cse": "ms cse",
+    "master of science in cse": "ms cse",
+    "ms data science": "ms dsa",
+    "data science": "ms dsa",
+}
+
+
 def normalize_department_name(dept_name: str) -> str:
     """Normalize department name to match DEPARTMENT_FILES keys"""
     
@@ -2926,80 +1954,21 @@ def normalize_department_name(dept_name: str) -> str:
     # Convert to lowercase and strip
     dept = dept_name.lower().strip()
     
-    # Mapping of variations to standard keys
-    dept_mappings = {
-        # CSE variations
-        "computer science and engineering": "cse",
-        "computer science & engineering": "cse",
-        "computer science": "cse",
-        "comp sci": "cse",
-        "cs": "cse",
-        "cse": "cse",
-        
-        # EEE variations
-        "electrical and electronics engineering": "eee",
-        "electrical & electronics engineering": "eee",
-        "electrical and electronics": "eee",
-        "electrical engineering": "eee",
-        "electrical": "eee",
-        "eee": "eee",
-        "electrical and electronic engineering": "eee",
-        "electrical electronic engineering": "eee",     
-
-        
-        # ECE variations
-        "electronics and communication engineering": "ece",
-        "electronics & communication engineering": "ece",
-        "electronics and communication": "ece",
-        "electronics": "ece",
-        "ece": "ece",
-        
-        # Civil variations
-        "civil engineering": "civil",
-        "civil": "civil",
-        "ce": "civil",
-        
-        # BBA variations
-        "business administration": "bba",
-        "business": "bba",
-        "bba": "bba",
-        "ba": "bba",
-        
-        # Economics
-        "economics": "economics",
-        "eco": "economics",
-        
-        # English
-        "english": "english",
-        "eng": "english",
-        
-        # Pharmacy
-        "pharmacy": "pharmacy",
-        "pharm": "pharmacy",
-        
-        # Law
-        "law": "law",
-        
-        # Math
-        "mathematics": "math",
-        "math": "math",
-        
-        # Sociology
-        "sociology": "sociology",
-        "soc": "sociology",
-        
-        # Graduate
-        "mba": "mba",
-        "emba": "emba",
-        "ms cse": "ms cse",
-        "msc cse": "ms cse",
-        "master of science in cse": "ms cse",
-        "ms data science": "ms dsa",
-        "data science": "ms dsa",
-    }
-    
     # Return mapped value or original lowercase
-    return dept_mappings.get(dept, dept)
+    return DEPARTMENT_ALIASES.get(dept, dept)
+
+
+# Any accepted spelling -> course file, so resolving a department is a single lookup
+DEPARTMENT_FILE_BY_ALIAS = {key: filename for key, filename in DEPARTMENT_FILES.items()
+                            if key not in DEPARTMENT_ALIASES}
+DEPARTMENT_FILE_BY_ALIAS.update((alias, DEPARTMENT_FILES[key]) for alias, key in DEPARTMENT_ALIASES.items()
+                                if key in DEPARTMENT_FILES)
+
+def resolve_department_file(dept_name: str):
+    """Course file for a department name in any accepted spelling, or None"""
+    if not dept_name:
+        return None
+    return DEPARTMENT_FILE_BY_ALIAS.get(dept_name.lower().strip())
 
 
 
@@ -3020,155 +1989,6 @@ def normalize_department_name(dept_name: str) -> str:
 
 
 
-# ============================================================================
-# ============================================================================
-
-DEPARTMENT_FILES = {
-    # Undergraduate
-    "cse": "st_cse.json",
-    "computer science": "st_cse.json",
-    "cs": "st_cse.json",
-    
-    "eee": "st_eee.json",
-    "electrical": "st_eee.json",
-    
-    "ece": "st_ece.json",
-    "electronics": "st_ece.json",
-    
-    "ce": "st_ce.json",
-    "civil": "st_ce.json",
-    
-    "bba": "st_ba.json",
-    "business": "st_ba.json",
-    
-    "economics": "st_economics.json",
-    "eco": "st_economics.json",
-    
-    "english": "st_english.json",
-    "eng": "st_english.json",
-    
-    "pharmacy": "st_pharmacy.json",
-    "pharm": "st_pharmacy.json",
-    
-    "law": "st_law.json",
-    
-    "math": "st_math.json",
-    "mathematics": "st_math.json",
-    
-    "sociology": "st_sociology.json",
-    "soc": "st_sociology.json",
-    
-    "social relations": "st_social_relations.json",
-    
-    # Graduate
-    "mba": "mba_emba.json",
-    "emba": "mba_emba.json",
-    
-    "ms cse": "ms_cse.json",
-    "msc cse": "ms_cse.json",
-    
-    "ms dsa": "ms_dsa.json",
-    "data science": "ms_dsa.json",
-    
-    "ma english": "ma_english.json",
-    
-    "mds": "mds.json",
-    "development studies": "mds.json",
-    
-    "mss economics": "mss_eco.json",
-    "mss eco": "mss_eco.json",
-    
-    "mphil pharmacy": "mphil_pharmacy.json",
-    
-    "tesol": "tesol.json",
-}
-
-
-def normalize_department_name(dept_name: str) -> str:
-    """Normalize department name to match DEPARTMENT_FILES keys"""
-    
-    if not dept_name:
-        return ""
-    
-    # Convert to lowercase and strip
-    dept = dept_name.lower().strip()
-    
-    # Mapping of variations to standard keys
-    dept_mappings = {
-        # CSE variations
-        "computer science and engineering": "cse",
-        "computer science & engineering": "cse",
-        "computer science": "cse",
-        "comp sci": "cse",
-        "cs": "cse",
-        "cse": "cse",
-        
-        # EEE variations
-        "electrical and electronics engineering": "eee",
-        "electrical & electronics engineering": "eee",
-        "electrical and electronics": "eee",
-        "electrical engineering": "eee",
-        "electrical": "eee",
-        "electrical and electronic engineering" 
-        "eee": "eee",
-        
-        # ECE variations
-        "electronics and communication engineering": "ece",
-        "electronics & communication engineering": "ece",
-        "electronics and communication": "ece",
-        "electronics": "ece",
-        "ece": "ece",
-        
-        # Civil variations
-        "civil engineering": "civil",
-        "civil": "civil",
-        "ce": "civil",
-        
-        # BBA variations
-        "business administration": "bba",
-        "business": "bba",
-        "bba": "bba",
-        "ba": "bba",
-        
-        # Economics
-        "economics": "economics",
-        "eco": "economics",
-        
-        # English
-        "english": "english",
-        "eng": "english",
-        
-        # Pharmacy
-        "pharmacy": "pharmacy",
-        "pharm": "pharmacy",
-        
-        # Law
-        "law": "law",
-        
-        # Math
-        "mathematics": "math",
-        "math": "math",
-        
-        # Sociology
-        "sociology": "sociology",
-        "soc": "sociology",
-        
-        # Graduate
-        "mba": "mba",
-        "emba": "emba",
-        "ms cse": "ms cse",
-        "msc cse": "ms cse",
-        "master of science in cse": "ms cse",
-        "ms data science": "ms dsa",
-        "data science": "ms dsa",
-    }
-    
-    # Return mapped value or original lowercase
-    return dept_mappings.get(dept, dept)
-
-
-
-
 # ============================================================================
 # ACTION: Show All Courses
 # ============================================================================
@@ -3190,12 +2010,8 @@ class ActionShowCourses(Action):
         department = normalize_department_name(tracker.get_slot("department"))
         
         if not department:
-            # Try to get from entities
-            entities = tracker.latest_message.get('entities', [])
-            for entity in entities:
-                if entity['entity'] == 'department':
-                    department = entity['value']
-                    break
+            # Try to get from entities (canonical spelling, so the reply cache below stays bounded)
+            department = normalize_department_name(next(tracker.get_latest_entity_values("department"), None))
         
         if not department:
             dispatcher.utter_message(
@@ -3204,7 +2020,7 @@ class ActionShowCourses(Action):
             return []
         
         # Find matching file
-        filename = DEPARTMENT_FILES.get(department)
+        filename = resolve_department_file(department)
         
         if not filename:
             return call_rag_fallback(dispatcher, tracker, domain)
@@ -3224,8 +2040,11 @@ class ActionShowCourses(Action):
             )
             return [SlotSet("department", None)]
         
-        # Format and send response
-        response = self._format_courses_response(department, courses, data)
+        # Format and send response (rendered once per department and loaded file)
+        replies = derived_view(data, reply_cache, ("courses", filename))
+        response = replies.get(department)
+        if response is None:
+            response = replies[department] = self._format_courses_response(department, courses, data)
         dispatcher.utter_message(text=response)
         
         return [SlotSet("department", department)]
@@ -3268,46 +2087,45 @@ class ActionShowCourses(Action):
             'N/A'
         )
         
-        response = f"📚 **{program_name} Courses**\n\n"
-        response += f"**Total Credits:** {total_credits}\n\n"
+        parts = [f"📚 **{program_name} Courses**\n\n", f"**Total Credits:** {total_credits}\n\n"]
         
         # Show course summaries if available
         course_summaries = data.get('course_summaries', {})
         if course_summaries:
-            response += "**Credit Distribution:**\n"
+            parts.append("**Credit Distribution:**\n")
             for category, credits in course_summaries.items():
                 category_name = category.replace('_', ' ').title()
-                response += f"• {category_name}: {credits}\n"
-            response += "\n"
+                parts.append(f"• {category_name}: {credits}\n")
+            parts.append("\n")
         
         # Group courses by category
         grouped = self._group_courses_by_category(courses)
         
         if grouped:
             for category, cat_courses in list(grouped.items())[:5]:
-                response += f"**{category}:**\n"
+                parts.append(f"**{category}:**\n")
                 for course in cat_courses[:8]:
                     code = course.get('code', course.get('course_code', 'N/A'))
                     name = course.get('name', course.get('title', 'N/A'))
                     credits = course.get('credits', course.get('credit', 'N/A'))
-                    response += f"• {code} - {name} ({credits} cr)\n"
+                    parts.append(f"• {code} - {name} ({credits} cr)\n")
                 
                 if len(cat_courses) > 8:
-                    response += f"  ... and {len(cat_courses) - 8} more\n"
-                response += "\n"
+                    parts.append(f"  ... and {len(cat_courses) - 8} more\n")
+                parts.append("\n")
         else:
-            response += "**Course List:**\n"
+            parts.append("**Course List:**\n")
             for course in courses[:15]:
                 code = course.get('code', course.get('course_code', 'N/A'))
                 name = course.get('name', course.get('title', 'N/A'))
                 credits = course.get('credits', course.get('credit', 'N/A'))
-                response += f"• {code} - {name} ({credits} cr)\n"
+                parts.append(f"• {code} - {name} ({credits} cr)\n")
             
             if len(courses) > 15:
-                response += f"\n... and {len(courses) - 15} more courses\n\n"
+                parts.append(f"\n... and {len(courses) - 15} more courses\n\n")
         
-        response += f"Please visit https://www.ewubd.edu for more information."
-        return response
+        parts.append("Please visit https://www.ewubd.edu for more information.")
+        return "".join(parts)
     
     def _group_courses_by_category(self, courses: List[dict]) -> Dict[str, List[dict]]:
         grouped = {}
@@ -3323,6 +2141,23 @@ class ActionShowCourses(Action):
             grouped[category].append(course)
         return grouped if len(grouped) > 1 else {}
 
+# Every distinct course file, in DEPARTMENT_FILES order
+COURSE_FILES = tuple(dict.fromkeys(DEPARTMENT_FILES.values()))
+
+# Course codes are compared upper-cased with spaces and dashes removed ("cse 101", "CSE-101" -> "CSE101")
+_COURSE_CODE_STRIP = str.maketrans('', '', ' -')
+
+def normalize_course_code(code: str) -> str:
+    return code.upper().translate(_COURSE_CODE_STRIP)
+
+def index_courses(data):
+    """Map each normalized course code in one course file to its first course entry"""
+    courses = data if isinstance(data, list) else data.get('courses', [])
+    index = {}
+    for course in courses:
+        index.setdefault(normalize_course_code(course.get('code', course.get('course_code', ''))), course)
+    return index
+
 class ActionShowCourseDetails(Action):
     """Show details of a specific course by code"""
     def name(self) -> Text:
@@ -3331,15 +2166,12 @@ class ActionShowCourseDetails(Action):
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         course_code = tracker.get_slot("course_code")
         if not course_code:
-            entities = tracker.latest_message.get('entities', [])
-            for entity in entities:
-                if entity['entity'] == 'course_code':
-                    course_code = entity['value']; break
+            course_code = next(tracker.get_latest_entity_values("course_code"), None)
         if not course_code:
             dispatcher.utter_message(text="Please provide a course code. For example: CSE101")
             return []
         
-        course_code = course_code.upper().replace(' ', '').replace('-', '')
+        course_code = normalize_course_code(course_code)
         course_info = self._find_course(course_code)
         
         if not course_info:
@@ -3350,13 +2182,11 @@ class ActionShowCourseDetails(Action):
         return [SlotSet("course_code", course_code)]
     
     def _find_course(self, course_code: str) -> dict:
-        for filename in set(DEPARTMENT_FILES.values()):
+        for filename in COURSE_FILES:
             data = load_json_file(filename)
             if not data: continue
-            courses = data.get('courses', data if isinstance(data, list) else [])
-            for course in courses:
-                code = course.get('code', course.get('course_code', '')).upper().replace(' ', '').replace('-', '')
-                if code == course_code: return course
+            course = derived_view(data, index_courses, filename).get(course_code)
+            if course: return course
         return None
     
     def _format_course_details(self, course_code: str, course: dict) -> str:
@@ -3367,10 +2197,10 @@ class ActionShowCourseDetails(Action):
         category = course.get('category', 'N/A')
         desc = course.get('description', 'No description available')
         
-        res = f"**Course Details**\n\n**Code:** {code}\n**Name:** {name}\n**Credits:** {credits}\n**Prerequisites:** {prereq}\n**Category:** {category}\n\n"
-        if desc and desc != 'No description available': res += f"**Description:**\n{desc}\n\n"
-        res += "Please visit https://www.ewubd.edu for more information."
-        return res
+        parts = [f"**Course Details**\n\n**Code:** {code}\n**Name:** {name}\n**Credits:** {credits}\n**Prerequisites:** {prereq}\n**Category:** {category}\n\n"]
+        if desc and desc != 'No description available': parts.append(f"**Description:**\n{desc}\n\n")
+        parts.append("Please visit https://www.ewubd.edu for more information.")
+        return "".join(parts)
 
 class ActionShowCredits(Action):
     """Show total credits for a program"""
@@ -3380,29 +2210,32 @@ class ActionShowCredits(Action):
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         department = normalize_department_name(tracker.get_slot("department"))
         if not department:
-            entities = tracker.latest_message.get('entities', [])
-            for entity in entities:
-                if entity['entity'] == 'department':
-                    department = entity['value']; break
+            department = normalize_department_name(next(tracker.get_latest_entity_values("department"), None))
         if not department:
             dispatcher.utter_message(text="Which program? (e.g., CSE, BBA)")
             return []
         
-        filename = DEPARTMENT_FILES.get(department)
+        filename = resolve_department_file(department)
         if not filename: return call_rag_fallback(dispatcher, tracker, domain)
         data = load_json_file(filename)
         if not data: return call_rag_fallback(dispatcher, tracker, domain)
         
+        replies = derived_view(data, reply_cache, ("credits", filename))
+        response = replies.get(department)
+        if response is None:
+            response = replies[department] = self._format_credits_response(department, data)
+        dispatcher.utter_message(text=response)
+        return [SlotSet("department", department)]
+
+    def _format_credits_response(self, department: str, data: dict) -> str:
         dept_info = data.get('department_info', {})
         program_name = dept_info.get('program_name') or dept_info.get('department_name') or data.get('program_name') or department.upper()
         total_credits = dept_info.get('total_credits') or dept_info.get('minimum_credits_required') or data.get('total_credits') or 'N/A'
         
-        res = f"**{program_name} Credit Requirements**\n\n**Total Credits:** {total_credits}\n\n"
+        parts = [f"**{program_name} Credit Requirements**\n\n**Total Credits:** {total_credits}\n\n"]
         breakdown = data.get('course_summaries', data.get('credit_breakdown', {}))
         if breakdown:
-            res += "**Credit Breakdown:**\n"
-            for cat, creds in breakdown.items():
-                res += f"• {cat.replace('_', ' ').title()}: {creds}\n"
-        res += "\nPlease visit https://www.ewubd.edu for more information."
-        dispatcher.utter_message(text=res)
-        return [SlotSet("department", department)]
+            parts.append("**Credit Breakdown:**\n")
+            parts.extend(f"• {cat.replace('_', ' ').title()}: {creds}\n" for cat, creds in breakdown.items())
+        parts.append("\nPlease visit https://www.ewubd.edu for more information.")
+        return "".join(parts)
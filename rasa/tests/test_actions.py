@@ -0,0 +1,223 @@
+import asyncio
+import inspect
+import os
+import sys
+
+import pytest
+import yaml
+from rasa_sdk import Tracker
+from rasa_sdk.executor import CollectingDispatcher
+
+RASA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(RASA_DIR, "actions"))
+
+import actions  # noqa: E402
+
+RAG_FALLBACK = "<rag fallback>"
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Serve knowledge base files from a dict instead of BASE_URL; unknown files fail like a 404"""
+    def install(files):
+        actions.invalidate_knowledge_base()
+
+        def fetch(filename):
+            data = files.get(filename)
+            if data is not None:
+                actions._JSON_CACHE[filename] = (data, 0.0)
+            return data
+
+        monkeypatch.setattr(actions, "_fetch_json", fetch)
+    yield install
+    actions.invalidate_knowledge_base()
+
+
+@pytest.fixture(autouse=True)
+def no_rag(monkeypatch):
+    def fallback(dispatcher, tracker, domain):
+        dispatcher.utter_message(text=RAG_FALLBACK)
+        return []
+
+    monkeypatch.setattr(actions, "call_rag_fallback", fallback)
+
+
+def run_action(action_name, intent="none"):
+    """Run a registered action for one user turn and return the texts it sent"""
+    action = next(cls for cls in actions.Action.__subclasses__() if cls().name() == action_name)()
+    tracker = Tracker("test", {}, {"text": intent, "intent": {"name": intent, "confidence": 1.0}, "entities": []},
+                      [], False, None, {}, "")
+    dispatcher = CollectingDispatcher()
+    result = action.run(dispatcher, tracker, {})
+    if inspect.iscoroutine(result):
+        asyncio.run(result)
+    return [message.get("text") for message in dispatcher.messages]
+
+
+def load_domain_intents():
+    with open(os.path.join(RASA_DIR, "domain.yml"), encoding="utf-8") as f:
+        intents = yaml.safe_load(f)["intents"]
+    # Entries are plain names or {name: {use_entities: ...}}
+    return {intent if isinstance(intent, str) else next(iter(intent)) for intent in intents}
+
+
+def test_tuition_intents_exist_in_domain():
+    # action_tuition_by_program picks the program from the intent name
+    missing = set(actions.TUITION_INTENT_KEYS) - load_domain_intents()
+    assert not missing, f"TUITION_INTENT_KEYS intents not in domain.yml: {sorted(missing)}"
+
+
+def test_facility_intents_exist_in_domain():
+    # action_facility_info picks the facility from the intent name
+    missing = set(actions.FACILITY_INTENT_KEYS) - load_domain_intents()
+    assert not missing, f"FACILITY_INTENT_KEYS intents not in domain.yml: {sorted(missing)}"
+
+
+UNDERGRADUATE_CALENDAR = [
+    {"program": "B.Sc. in CSE", "application_deadline": "Aug 1, 2025", "admission_test": "Aug 10, 2025 at 10:00 AM"},
+    {"program": "BBA", "application_deadline": "Aug 2, 2025", "admission_test": "Aug 11, 2025 at 10:00 AM"},
+]
+
+
+def test_admission_actions_survive_a_missing_calendar_section(serve):
+    serve({"dynamic_admission_calendar.json": {"undergraduate_admission": UNDERGRADUATE_CALENDAR}})
+
+    assert run_action("action_admission_deadline_cse") == [
+        "**B.Sc. in CSE**\n\n📅 **Application Deadline:** Aug 1, 2025\n📝 **Test Date:** Aug 10, 2025 at 10:00 AM"
+    ]
+    assert run_action("action_admission_test_date_cse") == [
+        "**Computer Science & Engineering (CSE) Admission Test**\n\n"
+        " **Test:** Aug 10, 2025 at 10:00 AM\n **Apply by:** Aug 1, 2025"
+    ]
+    assert run_action("action_admission_deadline_mba") == [RAG_FALLBACK]
+
+
+def test_admission_actions_skip_records_without_a_program(serve):
+    serve({"dynamic_admission_calendar.json": {
+        "undergraduate_admission": UNDERGRADUATE_CALENDAR,
+        "graduate_admission": [
+            {"application_deadline": "Sep 1, 2025", "admission_test": "Sep 5, 2025"},
+            "not a record",
+            {"program": "Executive MBA (EMBA)", "application_deadline": "Sep 2, 2025", "admission_test": "Sep 6, 2025"},
+            {"program": "MBA", "application_deadline": "Sep 3, 2025", "admission_test": "Sep 7, 2025"},
+        ],
+    }})
+
+    assert run_action("action_admission_deadline_mba") == [
+        "**MBA**\n\n📅 **Deadline:** Sep 3, 2025\n📝 **Test:** Sep 7, 2025"
+    ]
+    assert run_action("action_admission_deadline_emba") == [
+        "**Executive MBA (EMBA)**\n\n📅 **Deadline:** Sep 2, 2025\n📝 **Test:** Sep 6, 2025"
+    ]
+    assert run_action("action_admission_deadline_bba") == [
+        "**BBA**\n\n📅 **Application Deadline:** Aug 2, 2025\n📝 **Test Date:** Aug 11, 2025 at 10:00 AM"
+    ]
+
+
+# Replies below are the text the per-program actions sent before they were consolidated
+
+TUITION_FEES = {
+    "undergraduate_programs": {"detailed_fee_structure": [
+        {"program": "B.Sc. in Computer Science and Engineering (CSE)", "tuition_fees": 910000, "credits": 140,
+         "grand_total": 935000},
+        {"program": "BBA", "tuition_fees": 800000, "credits": 123, "grand_total": 825000},
+    ]},
+    "graduate_programs": {"detailed_fee_structure": [
+        {"program": "MA in TESOL", "tuition_fees": 280000, "credits": 42, "grand_total": 300000},
+        {"program": "MA in TESOL", "tuition_fees": 320000, "credits": 48, "grand_total": 340000},
+    ]},
+    "diploma_programs": {"detailed_fee_structure": [
+        {"program": "Post Graduate Diploma in Disaster Management (PPDM)", "tuition_fees": 150000, "credits": 30,
+         "grand_total": 165000},
+    ]},
+}
+
+CSE_FEE_REPLY = ("**B.Sc. in Computer Science & Engineering (CSE)**\n\n"
+                 " **Tuition Fee:** 910,000 BDT\n **Total Credits:** 140\n **Total Program Cost:** 935,000 BDT")
+BBA_FEE_REPLY = ("**BBA (Bachelor of Business Administration)**\n\n"
+                 " **Tuition Fee:** 800,000 BDT\n **Total Credits:** 123\n **Total Program Cost:** 825,000 BDT")
+TESOL_42_FEE_REPLY = ("**MA in TESOL (42 Credits)**\n\n"
+                      " **Tuition Fee:** 280,000 BDT\n **Total Credits:** 42\n **Total Program Cost:** 300,000 BDT")
+
+
+@pytest.mark.parametrize("intent, expected", [
+    ("tuition_cse", CSE_FEE_REPLY),
+    ("tuition_bba", BBA_FEE_REPLY),
+    ("ma_tesol_42_fee", TESOL_42_FEE_REPLY),
+    ("ma_tesol_48_fee", "**MA in TESOL (48 Credits)**\n\n"
+                        " **Tuition Fee:** 320,000 BDT\n **Total Credits:** 48\n **Total Program Cost:** 340,000 BDT"),
+    ("ppdm_diploma_fee", "**Post Graduate Diploma in Disaster Management (PPDM)**\n\n"
+                         " **Tuition Fee:** 150,000 BDT\n **Total Credits:** 30\n **Total Program Cost:** 165,000 BDT"),
+    ("ma_tesol_40_fee", RAG_FALLBACK),
+    ("tuition_eee", RAG_FALLBACK),
+    ("unrelated_intent", RAG_FALLBACK),
+])
+def test_tuition_by_program_replies(serve, intent, expected):
+    serve({"dynamic_tution_fees.json": TUITION_FEES})
+    assert run_action("action_tuition_by_program", intent) == [expected]
+
+
+def test_per_program_tuition_actions_match_the_consolidated_one(serve):
+    serve({"dynamic_tution_fees.json": TUITION_FEES})
+    assert run_action("action_tuition_cse") == [CSE_FEE_REPLY]
+    assert run_action("action_ma_tesol_42_fee") == [TESOL_42_FEE_REPLY]
+
+
+def test_tuition_replies_with_partial_fee_data(serve):
+    serve({"dynamic_tution_fees.json": {
+        "undergraduate_programs": {"detailed_fee_structure": [
+            TUITION_FEES["undergraduate_programs"]["detailed_fee_structure"][0],
+            {"program": "BBA", "tuition_fees": 800000, "credits": 123},
+        ]},
+    }})
+
+    assert run_action("action_tuition_by_program", "tuition_cse") == [CSE_FEE_REPLY]
+    assert run_action("action_tuition_by_program", "tuition_bba") == [RAG_FALLBACK]
+    assert run_action("action_tuition_by_program", "ma_tesol_42_fee") == [RAG_FALLBACK]
+
+
+def test_tuition_falls_back_without_the_fee_file(serve):
+    serve({})
+    assert run_action("action_tuition_by_program", "tuition_cse") == [RAG_FALLBACK]
+
+
+ADMISSION_CALENDAR = {
+    "undergraduate_admission": UNDERGRADUATE_CALENDAR,
+    "graduate_admission": [
+        {"program": "Executive MBA (EMBA)", "application_deadline": "Sep 2, 2025", "admission_test": "Sep 6, 2025"},
+        {"program": "MBA", "application_deadline": "Sep 3, 2025", "admission_test": "Sep 7, 2025"},
+    ],
+}
+
+
+@pytest.mark.parametrize("action_name, expected", [
+    ("action_admission_deadline_cse",
+     "**B.Sc. in CSE**\n\n📅 **Application Deadline:** Aug 1, 2025\n📝 **Test Date:** Aug 10, 2025 at 10:00 AM"),
+    ("action_admission_deadline_mba", "**MBA**\n\n📅 **Deadline:** Sep 3, 2025\n📝 **Test:** Sep 7, 2025"),
+    ("action_admission_deadline_emba",
+     "**Executive MBA (EMBA)**\n\n📅 **Deadline:** Sep 2, 2025\n📝 **Test:** Sep 6, 2025"),
+    ("action_admission_test_date_mba", "**MBA Admission Test**\n\n **Test:** Sep 7, 2025\n **Apply by:** Sep 3, 2025"),
+    ("action_admission_deadline_eee", RAG_FALLBACK),
+])
+def test_admission_replies(serve, action_name, expected):
+    serve({"dynamic_admission_calendar.json": ADMISSION_CALENDAR})
+    assert run_action(action_name) == [expected]
+
+
+def test_admission_falls_back_without_the_calendar(serve):
+    serve({})
+    assert run_action("action_admission_deadline_cse") == [RAG_FALLBACK]
+    assert run_action("action_admission_test_date_cse") == [RAG_FALLBACK]
+
+
+@pytest.mark.parametrize("facilities, intent, expected", [
+    ({"facilities": {"library": {"description": "Books."}}}, "library_facilities", "**Library Facilities**\n\nBooks."),
+    ({"facilities": {"cafeteria": {}}}, "cafeteria_facilities", "**Cafeteria Facilities**\n\nN/A"),
+    ({"facilities": {}}, "library_facilities", "**Library Facilities**\n\nN/A"),
+    # hostel_facilities is answered by utter_hostel, never by this action
+    ({"facilities": {"hostel_facilities": {"description": "Hostel."}}}, "hostel_facilities", RAG_FALLBACK),
+    (None, "library_facilities", RAG_FALLBACK),
+])
+def test_facility_info_replies(serve, facilities, intent, expected):
+    serve({} if facilities is None else {"dynamic_facilites.json": facilities})
+    assert run_action("action_facility_info", intent) == [expected]